@@ -4,6 +4,15 @@ from django.contrib.auth.models import User
 from rest_framework.test import APIClient
 from rest_framework.authtoken.models import Token
 from documents.models import Document
+from documents.services import DocumentService
+
+
+@pytest.fixture(autouse=True)
+def reset_anonymous_user_cache():
+    """Forget the cached anonymous user, which each test removes from the database."""
+    DocumentService._anonymous_user = None
+    yield
+    DocumentService._anonymous_user = None
 
 
 # User Fixtures
@@ -33,16 +42,8 @@ def admin_user():
 
 @pytest.fixture
 def anonymous_user():
-    """Get or create the anonymous user for testing."""
-    user, created = User.objects.get_or_create(
-        username="anonymous",
-        defaults={
-            "first_name": "Anonymous",
-            "last_name": "User",
-            "email": "anonymous@example.com",
-        },
-    )
-    return user
+    """Get the anonymous user, through the service's cached lookup."""
+    return DocumentService.get_anonymous_user()
 
 
 # Sample Content Fixtures
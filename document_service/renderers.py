@@ -0,0 +1,52 @@
+import orjson
+from rest_framework.renderers import JSONRenderer
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer that encodes with orjson.
+
+    Output is the same JSON as DRF's renderer with the default compact,
+    unicode settings, but not always byte for byte. Values orjson doesn't
+    encode natively (lazy translation strings, Decimals, querysets) and
+    datetimes, so they keep DRF's format, go through the encoder_class
+    default(). Indented output, as requested by the browsable API, is left
+    to DRF, as is anything orjson refuses to encode, such as integers beyond
+    64 bits.
+
+    Differences from DRF's output:
+
+    - floats are formatted differently, e.g. 1e-05 is written 0.00001 and
+      1e+16 as 1e16, which parse to the same values;
+    - NaN and infinite floats are written as null, where DRF's strict JSON
+      raises ValueError;
+    - dataclasses and UUID dict keys are encoded, where DRF raises TypeError.
+    """
+
+    options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        renderer_context = renderer_context or {}
+        if (
+            self.ensure_ascii
+            or not self.compact
+            or self.get_indent(accepted_media_type, renderer_context) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(
+                data, default=self.encoder_class().default, option=self.options
+            )
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Like DRF, escape \u2028 and \u2029 so the output is a strict
+        # JavaScript subset
+        if b"\xe2\x80\xa8" in ret or b"\xe2\x80\xa9" in ret:
+            ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028")
+            ret = ret.replace(b"\xe2\x80\xa9", b"\\u2029")
+        return ret
@@ -65,6 +65,25 @@ DATABASES = {
     )
 }
 
+# Queue search vector updates for the process_search_queue worker instead of
+# computing them inside every document write
+DEFER_SEARCH_VECTOR = os.getenv("DEFER_SEARCH_VECTOR", "False").lower() == "true"
+if DEFER_SEARCH_VECTOR:
+    # Add to any libpq options already configured rather than replacing them
+    _db_options = DATABASES["default"].setdefault("OPTIONS", {})
+    _db_options["options"] = (
+        _db_options.get("options", "") + " -c documents.defer_search_vector=on"
+    ).strip()
+
+# Also match titles by trigram similarity in search_documents. Needs the
+# pg_trgm extension, which migration 0010 enables and indexes when available.
+# The documents.E001 database check (run by migrate and
+# "manage.py check --database default") fails when it's missing.
+SEARCH_TITLE_TRIGRAM = os.getenv("SEARCH_TITLE_TRIGRAM", "False").lower() == "true"
+
+# Rows per INSERT when documents and change records are created in bulk
+BULK_CREATE_BATCH_SIZE = int(os.getenv("BULK_CREATE_BATCH_SIZE", "100"))
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         "NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator"
@@ -116,8 +135,13 @@ CHANNEL_LAYERS = {
 REST_FRAMEWORK = {
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 20,
+    # orjson renders JSON for the whole API, not only the change history. DRF's
+    # JSONRenderer still handles indented responses and integers beyond 64
+    # bits. Unlike DRF, floats such as search ranks are formatted differently
+    # (0.00001 for 1e-05), NaN and infinite floats render as null instead of
+    # raising ValueError, and dataclasses and UUID keys are encoded.
     "DEFAULT_RENDERER_CLASSES": [
-        "rest_framework.renderers.JSONRenderer",
+        "document_service.renderers.ORJSONRenderer",
         "rest_framework.renderers.BrowsableAPIRenderer",
     ],
     "DEFAULT_PARSER_CLASSES": [
@@ -0,0 +1,88 @@
+import datetime
+import json
+import uuid
+from decimal import Decimal
+
+import pytest
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ErrorDetail
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.serializer_helpers import ReturnDict, ReturnList
+
+from document_service.renderers import ORJSONRenderer
+
+
+@pytest.fixture
+def payload():
+    return ReturnDict(
+        {
+            "id": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+            "title": "Caf\u00e9 \u2028line\u2029 para",
+            "version": 3,
+            "ratio": Decimal("1.5"),
+            "updated_at": datetime.datetime(
+                2024, 1, 2, 3, 4, 5, 678901, tzinfo=datetime.timezone.utc
+            ),
+            "created_on": datetime.date(2024, 1, 2),
+            "naive": datetime.datetime(2024, 1, 2, 3, 4, 5),
+            "aware": timezone.make_aware(datetime.datetime(2024, 1, 2, 3, 4, 5)),
+            "message": gettext_lazy("This field is required."),
+            "errors": [ErrorDetail("Invalid", code="invalid")],
+            "changes": ReturnList(
+                [{"operation": "retain", "length": 5}], serializer=None
+            ),
+            1: "non-string key",
+            "empty": None,
+            "flag": True,
+        },
+        serializer=None,
+    )
+
+
+def test_orjson_renderer_matches_json_renderer(payload):
+    """Test that ORJSONRenderer produces the same bytes as DRF's JSONRenderer."""
+    assert ORJSONRenderer().render(payload) == JSONRenderer().render(payload)
+
+
+def test_orjson_renderer_escapes_line_separators(payload):
+    """Test that U+2028 and U+2029 are escaped like DRF does."""
+    rendered = ORJSONRenderer().render(payload)
+
+    assert b"\\u2028" in rendered
+    assert b"\\u2029" in rendered
+
+
+def test_orjson_renderer_none():
+    """Test that None renders as an empty body."""
+    assert ORJSONRenderer().render(None) == b""
+
+
+def test_orjson_renderer_indent_falls_back_to_json_renderer(payload):
+    """Test that indented output (browsable API) is rendered by DRF."""
+    context = {"indent": 4}
+
+    rendered = ORJSONRenderer().render(payload, renderer_context=context)
+
+    assert rendered == JSONRenderer().render(payload, renderer_context=context)
+    assert b"\n    " in rendered
+
+
+def test_orjson_renderer_falls_back_for_big_integers():
+    """Test that integers orjson can't encode are rendered by DRF."""
+    data = {"big": 2**70}
+
+    assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+
+
+def test_orjson_renderer_float_format():
+    """Test that floats keep orjson's formatting, which differs from DRF's."""
+    data = {"rank": 1e-05, "timing": 0.1, "large": 1e16, "whole": 2.0}
+
+    rendered = ORJSONRenderer().render(data)
+
+    assert rendered == b'{"rank":0.00001,"timing":0.1,"large":1e16,"whole":2.0}'
+    assert JSONRenderer().render(data) == (
+        b'{"rank":1e-05,"timing":0.1,"large":1e+16,"whole":2.0}'
+    )
+    assert json.loads(rendered) == data
@@ -326,8 +326,9 @@ class DocumentAPIClient:
             "changes": changes
         }
         
-        logger.info(f"APIClient.apply_changes called with document_id={document_id}, version={version}")
-        logger.info(f"Changes data: {changes}")
+        logger.info("APIClient.apply_changes called with document_id=%s, version=%s", document_id, version)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Changes data: %s", changes)
         
         status_code, response_data = self._make_request(
             "PATCH", 
@@ -335,7 +336,10 @@ class DocumentAPIClient:
             data
         )
         
-        logger.info(f"API response: status={status_code}, data={response_data}")
+        logger.info("API response: status=%s", status_code)
+        # The response carries the whole document
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("API response data: %s", response_data)
         
         if status_code == 200:
             logger.info("apply_changes succeeded")
@@ -0,0 +1,38 @@
+from django.conf import settings
+from django.core.checks import Error, Tags, register
+from django.db import connections
+
+
+def pg_trgm_installed(connection):
+    """Whether the pg_trgm extension is installed in the connection's database."""
+    if connection.vendor != "postgresql":
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+        return cursor.fetchone() is not None
+
+
+@register(Tags.database)
+def check_title_trigram_extension(app_configs=None, databases=None, **kwargs):
+    """
+    SEARCH_TITLE_TRIGRAM needs pg_trgm, which migration 0010 skips when the
+    extension isn't available. Without it every search fails.
+    """
+    if not settings.SEARCH_TITLE_TRIGRAM or not databases:
+        return []
+
+    errors = []
+    for alias in databases:
+        if not pg_trgm_installed(connections[alias]):
+            errors.append(
+                Error(
+                    "SEARCH_TITLE_TRIGRAM is enabled but the pg_trgm extension "
+                    f"is not installed in the '{alias}' database.",
+                    hint=(
+                        "Install PostgreSQL's contrib modules and re-run "
+                        "migration documents.0010, or unset SEARCH_TITLE_TRIGRAM."
+                    ),
+                    id="documents.E001",
+                )
+            )
+    return errors
@@ -259,32 +259,37 @@ class ContentDiffGenerator:
         Returns:
             Complete payload ready for API submission
         """
-        logger.info(f"Creating API payload for document {document_id}")
-        logger.info(f"Old content length: {len(old_content)}, New content length: {len(new_content)}")
-        logger.info(f"Old content repr: {repr(old_content)}")
-        logger.info(f"New content repr: {repr(new_content)}")
-        logger.info(f"Old content visual: {old_content.replace(chr(10), '¶LF').replace(chr(13), '¶CR')}")
-        logger.info(f"New content visual: {new_content.replace(chr(10), '¶LF').replace(chr(13), '¶CR')}")
+        logger.info("Creating API payload for document %s", document_id)
+        logger.info("Old content length: %d, New content length: %d", len(old_content), len(new_content))
+        # The content dumps copy both documents several times over; only
+        # build them for DEBUG
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("Old content repr: %r", old_content)
+            logger.debug("New content repr: %r", new_content)
+            logger.debug("Old content visual: %s", old_content.replace(chr(10), '¶LF').replace(chr(13), '¶CR'))
+            logger.debug("New content visual: %s", new_content.replace(chr(10), '¶LF').replace(chr(13), '¶CR'))
         
         # Normalize line endings to ensure consistency
         normalized_old_content = ContentDiffGenerator.normalize_line_endings(old_content)
         normalized_new_content = ContentDiffGenerator.normalize_line_endings(new_content)
         
-        logger.info(f"Normalized old content repr: {repr(normalized_old_content)}")
-        logger.info(f"Normalized new content repr: {repr(normalized_new_content)}")
+        if debug:
+            logger.debug("Normalized old content repr: %r", normalized_old_content)
+            logger.debug("Normalized new content repr: %r", normalized_new_content)
         
         change_data = ContentDiffGenerator.generate_operations_from_form_data(
             normalized_old_content, normalized_new_content, document_version, cursor_position
         )
         
-        logger.info(f"Generated {len(change_data['changes'])} operations")
+        logger.info("Generated %d operations", len(change_data['changes']))
         
         if optimize and change_data["changes"]:
             original_count = len(change_data["changes"])
             change_data["changes"] = ContentDiffGenerator.optimize_operations(
                 change_data["changes"]
             )
-            logger.info(f"Optimized operations from {original_count} to {len(change_data['changes'])}")
+            logger.info("Optimized operations from %d to %d", original_count, len(change_data['changes']))
         
         # Validate operations before creating payload using normalized content
         if not ContentDiffGenerator.validate_operations(change_data["changes"], normalized_old_content):
@@ -299,7 +304,9 @@ class ContentDiffGenerator:
             "operation_count": len(change_data["changes"])
         }
         
-        logger.info(f"Created API payload: {payload}")
+        logger.info("Created API payload with %d operations", payload["operation_count"])
+        if debug:
+            logger.debug("Created API payload: %s", payload)
         return payload
 
 
@@ -0,0 +1,116 @@
+"""
+Management command to compute search vectors for queued documents.
+
+When DEFER_SEARCH_VECTOR is enabled, document writes only record the
+document in the documents_searchqueue table instead of computing the
+tsvector on the request path. This command drains that queue:
+- Once, for use from cron or a one-off maintenance run
+- Continuously with --listen, waking on NOTIFY as soon as work is queued
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import InterfaceError, OperationalError, connection, transaction
+from documents.models import Document, SEARCH_VECTOR
+import select
+import time
+
+
+NOTIFY_CHANNEL = "documents_search_queue"
+
+# Seconds to wait before reconnecting after the database connection drops
+RECONNECT_DELAY = 5
+
+
+class Command(BaseCommand):
+    help = "Compute search vectors for documents queued by deferred indexing"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of queued documents to claim per transaction (default: 500)",
+        )
+        parser.add_argument(
+            "--listen",
+            action="store_true",
+            help="Keep running and process new entries as they are queued",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=30.0,
+            help="Seconds to wait for a notification before re-checking the queue (default: 30)",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+
+        if not options["listen"]:
+            processed = self.drain_queue(batch_size)
+            self.stdout.write(
+                self.style.SUCCESS(f"Processed {processed} queued documents")
+            )
+            return
+
+        self.stdout.write(f'Listening for queued documents on "{NOTIFY_CHANNEL}"...')
+        pg_connection = None
+        while True:
+            try:
+                if pg_connection is None:
+                    pg_connection = self.listen()
+
+                processed = self.drain_queue(batch_size)
+                if processed:
+                    self.stdout.write(f"Processed {processed} queued documents")
+
+                # Sleep until a writer notifies us or the poll interval elapses.
+                # Raw connection calls raise driver errors; wrap them so they
+                # surface as Django's OperationalError/InterfaceError.
+                with connection.wrap_database_errors:
+                    select.select([pg_connection], [], [], options["poll_interval"])
+                    pg_connection.poll()
+                pg_connection.notifies.clear()
+            except (OperationalError, InterfaceError) as exc:
+                # A restarted or unreachable server shouldn't kill the worker:
+                # drop the connection and LISTEN again on a new one. Anything
+                # queued meanwhile is picked up by the next drain.
+                self.stderr.write(
+                    f"Database connection lost ({exc}); "
+                    f"reconnecting in {RECONNECT_DELAY}s..."
+                )
+                connection.close()
+                pg_connection = None
+                time.sleep(RECONNECT_DELAY)
+
+    def listen(self):
+        """Subscribe to queue notifications and return the raw connection."""
+        with connection.cursor() as cursor:
+            cursor.execute(f"LISTEN {NOTIFY_CHANNEL}")
+        return connection.connection
+
+    def drain_queue(self, batch_size):
+        """Process queued documents until the queue is empty."""
+        processed = 0
+
+        while True:
+            with transaction.atomic(), connection.cursor() as cursor:
+                # SKIP LOCKED lets several workers drain the queue concurrently
+                cursor.execute(
+                    "SELECT document_id FROM documents_searchqueue "
+                    "ORDER BY enqueued_at LIMIT %s FOR UPDATE SKIP LOCKED",
+                    [batch_size],
+                )
+                document_ids = [row[0] for row in cursor.fetchall()]
+                if not document_ids:
+                    return processed
+
+                Document.objects.filter(pk__in=document_ids).update(
+                    search_vector=SEARCH_VECTOR
+                )
+                cursor.execute(
+                    "DELETE FROM documents_searchqueue WHERE document_id = ANY(%s)",
+                    [document_ids],
+                )
+
+            processed += len(document_ids)
@@ -8,12 +8,41 @@ This command is useful for:
 """
 
 from django.core.management.base import BaseCommand, CommandError
-from django.contrib.postgres.search import SearchVector
-from django.db import transaction
-from documents.models import Document
+from django.db import connections, transaction
+from documents.models import Document, SEARCH_VECTOR
+from collections import deque
+import multiprocessing
 import time
 
 
+# Minimum number of seconds between progress lines
+PROGRESS_INTERVAL = 1.0
+# Only the most recent error messages are echoed at the end of a run
+MAX_REPORTED_ERRORS = 1000
+
+
+def _update_chunk(pks):
+    """
+    Update search vectors for a chunk of document PKs.
+
+    Runs either in-process or inside a pool worker, so it only touches the
+    database through its own connection and reports back plain values. The
+    whole chunk is rebuilt with a single UPDATE ... WHERE id IN (...).
+
+    Returns:
+        Tuple of (processed count, error count, list of error messages)
+    """
+    try:
+        with transaction.atomic():
+            processed = Document.objects.filter(pk__in=pks).update(
+                search_vector=SEARCH_VECTOR
+            )
+    except Exception as e:
+        return 0, len(pks), [f'Batch processing error: {str(e)}']
+
+    return processed, 0, []
+
+
 class Command(BaseCommand):
     help = 'Update search vectors for all documents'
 
@@ -39,12 +68,25 @@ class Command(BaseCommand):
             action='store_true',
             help='Show what would be updated without making changes',
         )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help='Number of worker processes used to update batches (default: 1)',
+        )
+        parser.add_argument(
+            '--server-side',
+            action='store_true',
+            help='Rebuild all matching documents with a single UPDATE statement',
+        )
 
     def handle(self, *args, **options):
         batch_size = options['batch_size']
         force = options['force']
         document_id = options['document_id']
         dry_run = options['dry_run']
+        workers = max(1, options['workers'])
+        server_side = options['server_side']
 
         if dry_run:
             self.stdout.write(
@@ -61,7 +103,7 @@ class Command(BaseCommand):
                 raise CommandError(f'Document with ID "{document_id}" does not exist')
 
         # Handle all documents
-        self.update_all_documents(batch_size, force, dry_run)
+        self.update_all_documents(batch_size, force, dry_run, workers, server_side)
 
     def update_single_document(self, document, dry_run=False):
         """Update search vector for a single document."""
@@ -72,14 +114,9 @@ class Command(BaseCommand):
             return
 
         try:
-            content_text = document.content or ""
-            
             with transaction.atomic():
                 Document.objects.filter(pk=document.pk).update(
-                    search_vector=(
-                        SearchVector('title', weight='A') +
-                        SearchVector(models.Value(content_text), weight='B')
-                    )
+                    search_vector=SEARCH_VECTOR
                 )
             
             self.stdout.write(
@@ -91,7 +128,9 @@ class Command(BaseCommand):
                 self.style.ERROR(f'  ✗ Failed to update: {str(e)}')
             )
 
-    def update_all_documents(self, batch_size, force, dry_run):
+    def update_all_documents(
+        self, batch_size, force, dry_run, workers=1, server_side=False
+    ):
         """Update search vectors for all documents."""
         # Get documents that need updating
         if force:
@@ -126,44 +165,62 @@ class Command(BaseCommand):
         processed = 0
         errors = 0
 
+        if server_side:
+            self.stdout.write('Rebuilding search vectors with a single UPDATE...')
+            with transaction.atomic():
+                processed = documents.update(search_vector=SEARCH_VECTOR)
+            self.report_results(total_count, processed, errors, start_time)
+            return
+
         self.stdout.write(f'Processing documents in batches of {batch_size}...')
 
-        for i in range(0, total_count, batch_size):
-            batch = documents[i:i + batch_size]
-            
-            try:
-                with transaction.atomic():
-                    for document in batch:
-                        try:
-                            content_text = document.content or ""
-                            
-                            # Update the search vector
-                            Document.objects.filter(pk=document.pk).update(
-                                search_vector=(
-                                    SearchVector('title', weight='A') +
-                                    SearchVector(models.Value(content_text), weight='B')
-                                )
-                            )
-                            processed += 1
-                            
-                        except Exception as e:
-                            self.stdout.write(
-                                self.style.ERROR(
-                                    f'Error processing document {document.id}: {str(e)}'
-                                )
-                            )
-                            errors += 1
+        # Shard the PK space up front so batches can be handed to workers
+        pks = list(documents.order_by('pk').values_list('pk', flat=True))
+        chunks = [pks[i:i + batch_size] for i in range(0, len(pks), batch_size)]
+        total_count = len(pks)
+        progress = 0
+
+        if workers > 1:
+            self.stdout.write(f'Using {workers} worker processes')
+            # Forked workers must not share the parent's database connection
+            connections.close_all()
+            pool = multiprocessing.Pool(workers, initializer=connections.close_all)
+            results = pool.imap_unordered(_update_chunk, chunks)
+        else:
+            pool = None
+            results = map(_update_chunk, chunks)
+
+        # Error lines are held back and progress is throttled so large runs
+        # don't pay for a console write per batch
+        error_messages = deque(maxlen=MAX_REPORTED_ERRORS)
+        last_report = 0.0
+
+        try:
+            for chunk_processed, chunk_errors, messages in results:
+                processed += chunk_processed
+                errors += chunk_errors
+                error_messages.extend(messages)
 
                 # Progress update
-                progress = min(i + batch_size, total_count)
-                self.stdout.write(f'Processed {progress}/{total_count} documents...')
-                
-            except Exception as e:
-                self.stdout.write(
-                    self.style.ERROR(f'Batch processing error: {str(e)}')
-                )
-                errors += batch_size
+                progress = min(progress + batch_size, total_count)
+                now = time.monotonic()
+                if progress == total_count or now - last_report >= PROGRESS_INTERVAL:
+                    self.stdout.write(f'Processed {progress}/{total_count} documents...')
+                    last_report = now
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+
+        if error_messages:
+            self.stdout.write(
+                '\n'.join(self.style.ERROR(message) for message in error_messages)
+            )
+
+        self.report_results(total_count, processed, errors, start_time)
 
+    def report_results(self, total_count, processed, errors, start_time):
+        """Write the summary for a completed run."""
         # Final results
         end_time = time.time()
         duration = end_time - start_time
@@ -196,7 +253,3 @@ class Command(BaseCommand):
                     'Check the error messages above and consider running the command again.'
                 )
             )
-
-
-# Fix import issue
-from django.db import models
\ No newline at end of file
@@ -0,0 +1,27 @@
+# Generated by Django 4.2.30 on 2026-10-16 03:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("documents", "0005_search_vector_trigger"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="document",
+            name="content_hash",
+            field=models.CharField(
+                default="",
+                editable=False,
+                help_text="MD5 of content, used to detect changes without loading content",
+                max_length=32,
+            ),
+        ),
+        # Backfill server-side; matches Document.compute_content_hash()
+        migrations.RunSQL(
+            "UPDATE documents_document SET content_hash = md5(content);",
+            migrations.RunSQL.noop,
+        ),
+    ]
@@ -0,0 +1,51 @@
+from django.db import migrations
+
+
+# When the documents.defer_search_vector setting is on for a connection, the
+# trigger only queues the document and the process_search_queue command
+# computes the vector later. Otherwise it behaves exactly as in 0005.
+CREATE_QUEUE_SQL = """
+CREATE UNLOGGED TABLE documents_searchqueue (
+    document_id uuid PRIMARY KEY,
+    enqueued_at timestamptz NOT NULL DEFAULT now()
+);
+
+CREATE OR REPLACE FUNCTION documents_document_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    IF current_setting('documents.defer_search_vector', true) = 'on' THEN
+        INSERT INTO documents_searchqueue (document_id) VALUES (NEW.id)
+        ON CONFLICT (document_id) DO NOTHING;
+        PERFORM pg_notify('documents_search_queue', NEW.id::text);
+        RETURN NEW;
+    END IF;
+
+    NEW.search_vector :=
+        setweight(to_tsvector(COALESCE(NEW.title, '')), 'A') ||
+        setweight(to_tsvector(COALESCE(NEW.content, '')), 'B');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+"""
+
+DROP_QUEUE_SQL = """
+CREATE OR REPLACE FUNCTION documents_document_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector(COALESCE(NEW.title, '')), 'A') ||
+        setweight(to_tsvector(COALESCE(NEW.content, '')), 'B');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+DROP TABLE IF EXISTS documents_searchqueue;
+"""
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("documents", "0006_document_content_hash"),
+    ]
+
+    operations = [
+        migrations.RunSQL(CREATE_QUEUE_SQL, DROP_QUEUE_SQL),
+    ]
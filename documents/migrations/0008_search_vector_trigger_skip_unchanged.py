@@ -0,0 +1,58 @@
+from django.db import migrations
+
+
+# Full-model saves list title and content in the UPDATE even when neither
+# changed, which fires the trigger. Keep the stored vector (and skip queueing)
+# in that case instead of recomputing it or trusting the in-memory value.
+SKIP_UNCHANGED_SQL = """
+CREATE OR REPLACE FUNCTION documents_document_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'UPDATE'
+        AND NEW.title IS NOT DISTINCT FROM OLD.title
+        AND NEW.content IS NOT DISTINCT FROM OLD.content THEN
+        NEW.search_vector := OLD.search_vector;
+        RETURN NEW;
+    END IF;
+
+    IF current_setting('documents.defer_search_vector', true) = 'on' THEN
+        INSERT INTO documents_searchqueue (document_id) VALUES (NEW.id)
+        ON CONFLICT (document_id) DO NOTHING;
+        PERFORM pg_notify('documents_search_queue', NEW.id::text);
+        RETURN NEW;
+    END IF;
+
+    NEW.search_vector :=
+        setweight(to_tsvector(COALESCE(NEW.title, '')), 'A') ||
+        setweight(to_tsvector(COALESCE(NEW.content, '')), 'B');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+"""
+
+RESTORE_SQL = """
+CREATE OR REPLACE FUNCTION documents_document_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    IF current_setting('documents.defer_search_vector', true) = 'on' THEN
+        INSERT INTO documents_searchqueue (document_id) VALUES (NEW.id)
+        ON CONFLICT (document_id) DO NOTHING;
+        PERFORM pg_notify('documents_search_queue', NEW.id::text);
+        RETURN NEW;
+    END IF;
+
+    NEW.search_vector :=
+        setweight(to_tsvector(COALESCE(NEW.title, '')), 'A') ||
+        setweight(to_tsvector(COALESCE(NEW.content, '')), 'B');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+"""
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("documents", "0007_search_queue"),
+    ]
+
+    operations = [
+        migrations.RunSQL(SKIP_UNCHANGED_SQL, RESTORE_SQL),
+    ]
@@ -0,0 +1,41 @@
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("documents", "0008_search_vector_trigger_skip_unchanged"),
+    ]
+
+    operations = [
+        # These are PostgreSQL's GIN defaults: on a default-configured server
+        # this changes nothing, it only keeps a lowered server-wide
+        # gin_pending_list_limit from applying to this index. Storage
+        # parameters can be changed in place, so alter the existing index
+        # rather than dropping and rebuilding it.
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(
+                    "ALTER INDEX documents_d_search__05a045_gin "
+                    "SET (fastupdate = on, gin_pending_list_limit = 4096);",
+                    "ALTER INDEX documents_d_search__05a045_gin "
+                    "RESET (fastupdate, gin_pending_list_limit);",
+                ),
+            ],
+            state_operations=[
+                migrations.RemoveIndex(
+                    model_name="document",
+                    name="documents_d_search__05a045_gin",
+                ),
+                migrations.AddIndex(
+                    model_name="document",
+                    index=django.contrib.postgres.indexes.GinIndex(
+                        fastupdate=True,
+                        fields=["search_vector"],
+                        gin_pending_list_limit=4096,
+                        name="documents_d_search__05a045_gin",
+                    ),
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,29 @@
+from django.db import migrations
+
+
+# pg_trgm ships with PostgreSQL's contrib modules, which some installs leave
+# out. Only enable it and build the index when it is available; search only
+# uses trigram matching when SEARCH_TITLE_TRIGRAM is set.
+CREATE_TITLE_TRIGRAM_INDEX_SQL = """
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm') THEN
+        CREATE EXTENSION IF NOT EXISTS pg_trgm;
+        CREATE INDEX IF NOT EXISTS documents_document_title_trgm
+            ON documents_document USING gin (title gin_trgm_ops);
+    END IF;
+END
+$$;
+"""
+
+DROP_TITLE_TRIGRAM_INDEX_SQL = "DROP INDEX IF EXISTS documents_document_title_trgm;"
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("documents", "0009_search_vector_gin_fastupdate"),
+    ]
+
+    operations = [
+        migrations.RunSQL(CREATE_TITLE_TRIGRAM_INDEX_SQL, DROP_TITLE_TRIGRAM_INDEX_SQL),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-16 04:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("documents", "0010_title_trigram_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="documentchange",
+            index=models.Index(
+                fields=["document", "-applied_at"], name="docchange_doc_applied_idx"
+            ),
+        ),
+    ]
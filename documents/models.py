@@ -1,16 +1,31 @@
 import uuid
 import hashlib
 from django.db import models
+from django.db.models.functions import MD5
 from django.contrib.auth.models import User
 from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.contrib.postgres.indexes import GinIndex
 from django.urls import reverse
 
 
+# Weighted search vector computed from a document row's own columns; mirrors
+# the documents_document search vector trigger
+SEARCH_VECTOR = SearchVector('title', weight='A') + SearchVector('content', weight='B')
+
+# Marks a Document whose content_hash wasn't computed from its current content
+_UNHASHED = object()
+
+
 class Document(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     title = models.CharField(max_length=255)
     content = models.TextField(default="", help_text="Document content as plain text")
+    content_hash = models.CharField(
+        max_length=32,
+        default="",
+        editable=False,
+        help_text="MD5 of content, used to detect changes without loading content",
+    )
     version = models.IntegerField(default=1)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -29,7 +44,16 @@ class Document(models.Model):
     class Meta:
         ordering = ["-updated_at"]
         indexes = [
-            GinIndex(fields=['search_vector']),
+            # fastupdate and a 4MB pending list are PostgreSQL's defaults for
+            # GIN indexes. Setting them on the index pins them, so a lowered
+            # server-wide gin_pending_list_limit doesn't shrink the pending
+            # list document writes append to instead of merging postings.
+            GinIndex(
+                fields=['search_vector'],
+                name='documents_d_search__05a045_gin',
+                fastupdate=True,
+                gin_pending_list_limit=4096,
+            ),
         ]
 
     def __str__(self):
@@ -38,41 +62,113 @@ class Document(models.Model):
     def __repr__(self):
         return f"<Document: {self.title} (v{self.version})>"
 
+    # The content object content_hash was computed from, if any
+    _hashed_content = _UNHASHED
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # A loaded content_hash matches the loaded content
+        instance._hashed_content = instance.__dict__.get("content", _UNHASHED)
+        return instance
+
+    @property
+    def current_content_hash(self):
+        """
+        Hash of the content currently on the instance, saved or not.
+
+        Reuses content_hash while content is the value it was computed from
+        (or hasn't been loaded), so the full content isn't re-encoded and
+        re-hashed on every call. After content is reassigned, the hash is
+        computed from the new content.
+        """
+        content = self.__dict__.get("content", _UNHASHED)
+        if self.content_hash and (content is _UNHASHED or content is self._hashed_content):
+            return self.content_hash
+        return self.compute_content_hash(self.content)
+
     @property
     def etag(self):
-        content_with_version = f"{self.content}:{self.version}"
-        return hashlib.md5(content_with_version.encode()).hexdigest()
+        return hashlib.md5(f"{self.current_content_hash}:{self.version}".encode()).hexdigest()
+
+    def set_content_hash(self, content_hash=None):
+        """
+        Set content_hash for the current content.
+
+        Callers that already hashed the content can pass the hash in.
+        """
+        if content_hash is None:
+            content_hash = self.compute_content_hash(self.content)
+        self.content_hash = content_hash
+        self._hashed_content = self.content
 
     def increment_version(self):
         self.version += 1
         self.save()
 
-    def update_search_vector(self):
-        """Update the search vector with title and content text."""
+    def update_search_vector(self, refresh=False):
+        """Rebuild the search vector with title and content text.
+
+        Regular saves don't need this: a database trigger keeps the vector in
+        sync whenever title or content is written. The vector only backs the
+        GIN index, so it is not read back into the instance unless
+        ``refresh`` is set.
+        """
         # Search vectors must be updated using a database query, not direct assignment
-        Document.objects.filter(pk=self.pk).update(
-            search_vector=(
-                SearchVector('title', weight='A') +
-                SearchVector('content', weight='B')
-            )
-        )
-        # Refresh the instance to get the updated search vector
-        self.refresh_from_db(fields=['search_vector'])
+        Document.objects.filter(pk=self.pk).update(search_vector=SEARCH_VECTOR)
+        if refresh:
+            self.refresh_from_db(fields=['search_vector'])
+
+    @staticmethod
+    def compute_content_hash(content):
+        """Hash content the same way PostgreSQL's md5(content) would."""
+        return hashlib.md5(str(content or "").encode()).hexdigest()
 
     def save(self, *args, **kwargs):
-        # Check if this is an update that should increment version
-        if self.pk:
-            existing = Document.objects.filter(pk=self.pk).first()
-            if existing and (
-                existing.title != self.title or existing.content != self.content
-            ):
-                self.version += 1
-            
+        update_fields = kwargs.get('update_fields')
+        # Only hash content when this save writes it. A plain save() skips
+        # deferred fields, so a deferred content is neither saved nor loaded.
+        if update_fields is None:
+            saves_content = 'content' not in self.get_deferred_fields()
+        else:
+            saves_content = 'content' in update_fields
+        if saves_content:
+            self.set_content_hash(self.current_content_hash)
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, 'content_hash'}
+
+        # Check if this is an update that should increment version, comparing
+        # hashes so the stored content never has to be fetched. New instances
+        # already have a UUID pk, so _state.adding is what marks them, and a
+        # save restricted to other fields can't change the version.
+        saves_tracked_fields = (
+            update_fields is None or bool({'title', 'content'} & set(update_fields))
+        )
+        if self.pk and not self._state.adding and saves_tracked_fields:
+            existing = (
+                Document.objects.filter(pk=self.pk)
+                .values_list('title', 'content_hash')
+                .first()
+            )
+            if existing:
+                stored_title, stored_hash = existing
+                content_changed = False
+                if saves_content:
+                    if not stored_hash:
+                        # Rows inserted without save(), e.g. by bulk_create,
+                        # have no stored hash: hash the stored content in
+                        # the database rather than treat it as changed
+                        stored_hash = (
+                            Document.objects.filter(pk=self.pk)
+                            .values_list(MD5('content'), flat=True)
+                            .first()
+                        )
+                    content_changed = stored_hash != self.content_hash
+                if stored_title != self.title or content_changed:
+                    self.version += 1
+
+        # search_vector is maintained by the documents_document trigger
         super().save(*args, **kwargs)
-        
-        # Always update search vector after saving (unless using update_fields)
-        if 'update_fields' not in kwargs:
-            self.update_search_vector()
 
     def get_absolute_url(self):
         return reverse("document_detail", kwargs={"pk": self.pk})
@@ -100,6 +196,14 @@ class DocumentChange(models.Model):
 
     class Meta:
         ordering = ["-applied_at"]
+        indexes = [
+            # History is always read per document, newest first: serve the
+            # ORDER BY ... LIMIT from the index instead of sorting every change
+            models.Index(
+                fields=["document", "-applied_at"],
+                name="docchange_doc_applied_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"Change to {self.document.title} (v{self.from_version} -> v{self.to_version})"
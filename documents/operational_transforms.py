@@ -11,13 +11,78 @@ The OT system supports three basic operations:
 3. Retain - Keep existing text unchanged (for composing operations)
 """
 
-from typing import List, Dict, Any, Tuple, Union
-from dataclasses import dataclass
+from typing import List, Dict, Any, Iterable, Tuple, Union
+from dataclasses import dataclass, field
 from enum import Enum
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Size of the first slice compared when scanning for a common prefix/suffix;
+# each matching slice doubles the next one
+_SCAN_INITIAL_STEP = 64
+
+# Characters on either side of a known cursor position that are scanned
+# rather than assumed unchanged in generate_incremental_operations
+_CURSOR_WINDOW = 256
+
+
+def _common_prefix_len(a: str, b: str, start: int = 0) -> int:
+    """
+    Length of the common prefix of a and b.
+    
+    Gallops forward in doubling slices, then bisects the first mismatching
+    slice, so only O(log n) C-level slice comparisons are made. The first
+    start characters are assumed to match and are not compared.
+    """
+    limit = min(len(a), len(b))
+    lo = start
+    step = _SCAN_INITIAL_STEP
+    while True:
+        if lo >= limit:
+            return limit
+        hi = min(lo + step, limit)
+        if a[lo:hi] != b[lo:hi]:
+            break
+        lo = hi
+        step *= 2
+    
+    # a[:lo] matches and a[lo:hi] doesn't; narrow down to the first mismatch
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if a[lo:mid] == b[lo:mid]:
+            lo = mid
+        else:
+            hi = mid
+    return lo
+
+
+def _common_suffix_len(a: str, b: str, limit: int, start: int = 0) -> int:
+    """
+    Length of the common suffix of a and b, capped at limit.
+    
+    As with _common_prefix_len, the last start characters are assumed to match.
+    """
+    a_len, b_len = len(a), len(b)
+    lo = start
+    step = _SCAN_INITIAL_STEP
+    while True:
+        if lo >= limit:
+            return limit
+        hi = min(lo + step, limit)
+        if a[a_len - hi:a_len - lo] != b[b_len - hi:b_len - lo]:
+            break
+        lo = hi
+        step *= 2
+    
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if a[a_len - mid:a_len - lo] == b[b_len - mid:b_len - lo]:
+            lo = mid
+        else:
+            hi = mid
+    return lo
+
 
 class OperationType(Enum):
     """Types of operational transform operations."""
@@ -26,7 +91,17 @@ class OperationType(Enum):
     RETAIN = "retain"
 
 
-@dataclass
+# Module-level aliases for hot paths: looking up a member on the Enum class
+# goes through the metaclass and is several times slower than a global read
+INSERT = OperationType.INSERT
+DELETE = OperationType.DELETE
+RETAIN = OperationType.RETAIN
+
+# Enum .value goes through a descriptor on every access
+_TYPE_VALUES = {op_type: op_type.value for op_type in OperationType}
+
+
+@dataclass(slots=True)
 class OTOperation:
     """
     Represents a single operational transform operation.
@@ -37,28 +112,28 @@ class OTOperation:
         content: Text content (for insert operations)
         length: Number of characters (for delete/retain operations)
         attributes: Additional attributes (for future formatting support)
+        content_len: len(content), cached since transforms read it repeatedly
     """
     op_type: OperationType
     position: int = 0
     content: str = ""
     length: int = 0
     attributes: Dict[str, Any] = None
+    content_len: int = field(default=0, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         if self.attributes is None:
             self.attributes = {}
+        self.content_len = len(self.content)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert operation to dictionary for serialization."""
-        result = {
-            "op_type": self.op_type.value,
-            "position": self.position
-        }
-        
-        if self.op_type == OperationType.INSERT:
-            result["content"] = self.content
-        elif self.op_type in (OperationType.DELETE, OperationType.RETAIN):
-            result["length"] = self.length
+        op_type = self.op_type
+        # Build each shape as one literal; every non-insert type has a length
+        if op_type is INSERT:
+            result = {"op_type": _TYPE_VALUES[op_type], "position": self.position, "content": self.content}
+        else:
+            result = {"op_type": _TYPE_VALUES[op_type], "position": self.position, "length": self.length}
             
         if self.attributes:
             result["attributes"] = self.attributes
@@ -78,10 +153,26 @@ class OTOperation:
             attributes=data.get("attributes", {})
         )
     
+    def with_position(self, position: int, length: int = None) -> 'OTOperation':
+        """
+        Copy of this operation moved to position (and optionally resized).
+        
+        Content and attributes are shared with the original rather than copied.
+        Transforms call this instead of dataclasses.replace, which is several
+        times slower because it re-reads the dataclass fields on every call.
+        """
+        return OTOperation(
+            self.op_type,
+            position,
+            self.content,
+            self.length if length is None else length,
+            self.attributes
+        )
+    
     def __str__(self) -> str:
-        if self.op_type == OperationType.INSERT:
+        if self.op_type == INSERT:
             return f"Insert(pos={self.position}, content='{self.content}')"
-        elif self.op_type == OperationType.DELETE:
+        elif self.op_type == DELETE:
             return f"Delete(pos={self.position}, length={self.length})"
         else:  # RETAIN
             return f"Retain(length={self.length})"
@@ -95,6 +186,8 @@ class OTOperationSet:
     for collaborative editing scenarios.
     """
     
+    __slots__ = ('operations',)
+    
     def __init__(self, operations: List[OTOperation] = None):
         self.operations = operations or []
     
@@ -105,7 +198,7 @@ class OTOperationSet:
     def insert(self, position: int, content: str, attributes: Dict[str, Any] = None) -> 'OTOperationSet':
         """Add an insert operation."""
         op = OTOperation(
-            op_type=OperationType.INSERT,
+            op_type=INSERT,
             position=position,
             content=content,
             attributes=attributes or {}
@@ -116,7 +209,7 @@ class OTOperationSet:
     def delete(self, position: int, length: int, attributes: Dict[str, Any] = None) -> 'OTOperationSet':
         """Add a delete operation."""
         op = OTOperation(
-            op_type=OperationType.DELETE,
+            op_type=DELETE,
             position=position,
             length=length,
             attributes=attributes or {}
@@ -127,7 +220,7 @@ class OTOperationSet:
     def retain(self, length: int, attributes: Dict[str, Any] = None) -> 'OTOperationSet':
         """Add a retain operation."""
         op = OTOperation(
-            op_type=OperationType.RETAIN,
+            op_type=RETAIN,
             length=length,
             attributes=attributes or {}
         )
@@ -151,54 +244,86 @@ class OTOperationSet:
         Raises:
             ValueError: If operations are invalid or cannot be applied
         """
-        logger.info(f"OTOperationSet.apply called with text: '{text}' (length: {len(text)})")
-        logger.info(f"Applying {len(self.operations)} operations: {self.operations}")
+        operations = self.operations
+        # No-change sets (as generated for identical texts) leave text as is
+        if not operations or (
+            len(operations) == 1 and operations[0].op_type is RETAIN and
+            operations[0].length == len(text)
+        ):
+            return text
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "OTOperationSet.apply: %d operations on text of length %d",
+                len(operations), len(text)
+            )
+        return OTOperationSet.apply_operations(text, operations)
+    
+    @staticmethod
+    def apply_operations(text: str, operations: Iterable[OTOperation]) -> str:
+        """
+        Apply operations from any iterable to a text string sequentially.
+        
+        Same semantics as apply(), but the operations are consumed once as
+        they're applied, so a generator can feed them without the whole
+        operation list being built first.
+        
+        Args:
+            text: The original text to apply operations to
+            operations: Operations to apply, in order
+            
+        Returns:
+            The text after applying all operations sequentially
+            
+        Raises:
+            ValueError: If operations are invalid or cannot be applied
+        """
+        debug = logger.isEnabledFor(logging.DEBUG)
         
+        # ''.join sizes the output exactly and copies each character once, so
+        # the pieces are collected in a list rather than a StringIO/bytearray
         result = []
+        append = result.append
+        text_len = len(text)
         source_index = 0
         
-        for i, operation in enumerate(self.operations):
-            logger.info(f"Operation {i+1}: {operation}, source_index: {source_index}")
-            
-            if operation.op_type == OperationType.RETAIN:
+        for operation in operations:
+            # Enum members are singletons, so identity checks on a local
+            # are enough and skip Enum.__eq__
+            op_type = operation.op_type
+            if op_type is RETAIN:
                 # Retain: copy characters from source to result
                 end_index = source_index + operation.length
-                if end_index > len(text):
-                    logger.error(f"Retain operation extends beyond text length: {end_index} > {len(text)}")
-                    raise ValueError(f"Retain operation extends beyond text length: {end_index} > {len(text)}")
+                if end_index > text_len:
+                    logger.error("Retain operation extends beyond text length: %d > %d", end_index, text_len)
+                    raise ValueError(f"Retain operation extends beyond text length: {end_index} > {text_len}")
                 
-                retained_text = text[source_index:end_index]
-                result.append(retained_text)
+                append(text[source_index:end_index])
                 source_index = end_index
-                logger.info(f"  Retained: '{retained_text}', new source_index: {source_index}")
                 
-            elif operation.op_type == OperationType.DELETE:
+            elif op_type is DELETE:
                 # Delete: skip characters in source (don't copy to result)
                 end_index = source_index + operation.length
-                if end_index > len(text):
-                    logger.error(f"Delete operation extends beyond text length: {end_index} > {len(text)}")
-                    raise ValueError(f"Delete operation extends beyond text length: {end_index} > {len(text)}")
+                if end_index > text_len:
+                    logger.error("Delete operation extends beyond text length: %d > %d", end_index, text_len)
+                    raise ValueError(f"Delete operation extends beyond text length: {end_index} > {text_len}")
                 
-                deleted_text = text[source_index:end_index]
                 source_index = end_index  # Skip the deleted characters
-                logger.info(f"  Deleted: '{deleted_text}', new source_index: {source_index}")
                 
-            elif operation.op_type == OperationType.INSERT:
+            elif op_type is INSERT:
                 # Insert: add content to result (don't advance source_index)
-                result.append(operation.content)
-                logger.info(f"  Inserted: '{operation.content}', source_index unchanged: {source_index}")
+                append(operation.content)
             
-            current_result = ''.join(result)
-            logger.info(f"  Result so far: '{current_result}'")
+            if debug:
+                logger.debug("  %s, source_index: %d", operation, source_index)
         
         # Ensure we've processed all source text (implicit retain at end)
-        if source_index < len(text):
-            remaining_text = text[source_index:]
-            result.append(remaining_text)
-            logger.info(f"Added remaining text: '{remaining_text}'")
+        if source_index < text_len:
+            append(text[source_index:])
         
         final_result = ''.join(result)
-        logger.info(f"Final result: '{final_result}' (length: {len(final_result)})")
+        if debug:
+            logger.debug("OTOperationSet.apply result length: %d", len(final_result))
         
         return final_result
     
@@ -247,20 +372,20 @@ class OTTransformer:
             Tuple of transformed operations (op1', op2')
         """
         # Insert vs Insert
-        if op1.op_type == OperationType.INSERT and op2.op_type == OperationType.INSERT:
+        if op1.op_type == INSERT and op2.op_type == INSERT:
             return OTTransformer._transform_insert_insert(op1, op2, priority)
         
         # Insert vs Delete
-        elif op1.op_type == OperationType.INSERT and op2.op_type == OperationType.DELETE:
+        elif op1.op_type == INSERT and op2.op_type == DELETE:
             return OTTransformer._transform_insert_delete(op1, op2)
         
         # Delete vs Insert
-        elif op1.op_type == OperationType.DELETE and op2.op_type == OperationType.INSERT:
+        elif op1.op_type == DELETE and op2.op_type == INSERT:
             op2_prime, op1_prime = OTTransformer._transform_insert_delete(op2, op1)
             return op1_prime, op2_prime
         
         # Delete vs Delete
-        elif op1.op_type == OperationType.DELETE and op2.op_type == OperationType.DELETE:
+        elif op1.op_type == DELETE and op2.op_type == DELETE:
             return OTTransformer._transform_delete_delete(op1, op2)
         
         # If retain operations are involved, they don't conflict
@@ -272,41 +397,21 @@ class OTTransformer:
         """Transform two insert operations."""
         if op1.position < op2.position:
             # op1 inserts before op2, so op2's position needs to be adjusted
-            op2_prime = OTOperation(
-                op_type=op2.op_type,
-                position=op2.position + len(op1.content),
-                content=op2.content,
-                attributes=op2.attributes
-            )
+            op2_prime = op2.with_position(op2.position + op1.content_len)
             return op1, op2_prime
         
         elif op1.position > op2.position:
             # op2 inserts before op1, so op1's position needs to be adjusted
-            op1_prime = OTOperation(
-                op_type=op1.op_type,
-                position=op1.position + len(op2.content),
-                content=op1.content,
-                attributes=op1.attributes
-            )
+            op1_prime = op1.with_position(op1.position + op2.content_len)
             return op1_prime, op2
         
         else:  # Same position
             # Use priority to determine order
             if priority == "left":
-                op2_prime = OTOperation(
-                    op_type=op2.op_type,
-                    position=op2.position + len(op1.content),
-                    content=op2.content,
-                    attributes=op2.attributes
-                )
+                op2_prime = op2.with_position(op2.position + op1.content_len)
                 return op1, op2_prime
             else:
-                op1_prime = OTOperation(
-                    op_type=op1.op_type,
-                    position=op1.position + len(op2.content),
-                    content=op1.content,
-                    attributes=op1.attributes
-                )
+                op1_prime = op1.with_position(op1.position + op2.content_len)
                 return op1_prime, op2
     
     @staticmethod
@@ -314,109 +419,43 @@ class OTTransformer:
         """Transform insert operation against delete operation."""
         if insert_op.position <= delete_op.position:
             # Insert happens before delete, so delete position needs adjustment
-            delete_op_prime = OTOperation(
-                op_type=delete_op.op_type,
-                position=delete_op.position + len(insert_op.content),
-                length=delete_op.length,
-                attributes=delete_op.attributes
-            )
+            delete_op_prime = delete_op.with_position(delete_op.position + insert_op.content_len)
             return insert_op, delete_op_prime
         
         elif insert_op.position >= delete_op.position + delete_op.length:
             # Insert happens after delete, so insert position needs adjustment
-            insert_op_prime = OTOperation(
-                op_type=insert_op.op_type,
-                position=insert_op.position - delete_op.length,
-                content=insert_op.content,
-                attributes=insert_op.attributes
-            )
+            insert_op_prime = insert_op.with_position(insert_op.position - delete_op.length)
             return insert_op_prime, delete_op
         
         else:
             # Insert happens within delete range
             # Insert at the delete position, delete length increases
-            insert_op_prime = OTOperation(
-                op_type=insert_op.op_type,
-                position=delete_op.position,
-                content=insert_op.content,
-                attributes=insert_op.attributes
-            )
-            delete_op_prime = OTOperation(
-                op_type=delete_op.op_type,
-                position=delete_op.position,
-                length=delete_op.length + len(insert_op.content),
-                attributes=delete_op.attributes
-            )
+            insert_op_prime = insert_op.with_position(delete_op.position)
+            delete_op_prime = delete_op.with_position(delete_op.position, delete_op.length + insert_op.content_len)
             return insert_op_prime, delete_op_prime
     
     @staticmethod
     def _transform_delete_delete(op1: OTOperation, op2: OTOperation) -> Tuple[OTOperation, OTOperation]:
-        """Transform two delete operations."""
-        # Calculate ranges
+        """
+        Transform two delete operations.
+        
+        Each delete loses the characters the other one already removed, and
+        moves left by however much of the other range lay before it. This
+        covers disjoint, overlapping and nested ranges alike.
+        """
         op1_start, op1_end = op1.position, op1.position + op1.length
         op2_start, op2_end = op2.position, op2.position + op2.length
         
-        # No overlap - adjust positions
-        if op1_end <= op2_start:
-            # op1 deletes before op2
-            op2_prime = OTOperation(
-                op_type=op2.op_type,
-                position=op2.position - op1.length,
-                length=op2.length,
-                attributes=op2.attributes
-            )
-            return op1, op2_prime
+        intersection_length = max(0, min(op1_end, op2_end) - max(op1_start, op2_start))
+        op1_shift = max(0, min(op1_start, op2_end) - op2_start)
+        op2_shift = max(0, min(op2_start, op1_end) - op1_start)
         
-        elif op2_end <= op1_start:
-            # op2 deletes before op1
-            op1_prime = OTOperation(
-                op_type=op1.op_type,
-                position=op1.position - op2.length,
-                length=op1.length,
-                attributes=op1.attributes
-            )
-            return op1_prime, op2
+        if op1_shift or intersection_length:
+            op1 = op1.with_position(op1_start - op1_shift, op1.length - intersection_length)
+        if op2_shift or intersection_length:
+            op2 = op2.with_position(op2_start - op2_shift, op2.length - intersection_length)
         
-        else:
-            # Overlapping deletes - need to handle carefully
-            # Find the intersection and adjust both operations
-            intersection_start = max(op1_start, op2_start)
-            intersection_end = min(op1_end, op2_end)
-            intersection_length = intersection_end - intersection_start
-            
-            # Adjust op1
-            if op1_start < intersection_start:
-                op1_prime = OTOperation(
-                    op_type=op1.op_type,
-                    position=op1.position,
-                    length=intersection_start - op1_start,
-                    attributes=op1.attributes
-                )
-            else:
-                op1_prime = OTOperation(
-                    op_type=op1.op_type,
-                    position=op2.position,
-                    length=op1.length - intersection_length,
-                    attributes=op1.attributes
-                )
-            
-            # Adjust op2
-            if op2_start < intersection_start:
-                op2_prime = OTOperation(
-                    op_type=op2.op_type,
-                    position=op2.position,
-                    length=intersection_start - op2_start,
-                    attributes=op2.attributes
-                )
-            else:
-                op2_prime = OTOperation(
-                    op_type=op2.op_type,
-                    position=op1.position,
-                    length=op2.length - intersection_length,
-                    attributes=op2.attributes
-                )
-            
-            return op1_prime, op2_prime
+        return op1, op2
     
     @staticmethod
     def transform_operation_sets(ops1: OTOperationSet, ops2: OTOperationSet, priority: str = "left") -> Tuple[OTOperationSet, OTOperationSet]:
@@ -436,21 +475,60 @@ class OTTransformer:
         # the composition and interaction of multiple operations
         
         transformed_ops1 = []
-        transformed_ops2 = []
+        # Copied once and transformed in place, so every op2 ends up
+        # transformed against all of ops1
+        transformed_ops2 = list(ops2.operations)
+        
+        transform = OTTransformer.transform_operations
+        right_priority = priority != "left"
         
         # Transform each operation in ops1 against all operations in ops2
         for op1 in ops1.operations:
             current_op1 = op1
-            temp_ops2 = list(ops2.operations)
+            op1_type = op1.op_type
+            # Position of op1 including shifts not yet applied to current_op1
+            position = op1.position
             
-            for i, op2 in enumerate(temp_ops2):
-                current_op1, transformed_op2 = OTTransformer.transform_operations(
-                    current_op1, op2, priority
-                )
-                temp_ops2[i] = transformed_op2
+            for i, op2 in enumerate(transformed_ops2):
+                # Fast path for the common case of op2 lying entirely before
+                # op1: op2 is left as is and op1 only moves, so accumulate the
+                # shift instead of building a new op1 for every op2. The
+                # conditions mirror the transform_operations branches.
+                op2_type = op2.op_type
+                if op1_type is INSERT:
+                    if op2_type is INSERT:
+                        if op2.position < position or (op2.position == position and right_priority):
+                            position += op2.content_len
+                            continue
+                    elif op2_type is DELETE:
+                        if position > op2.position and position >= op2.position + op2.length:
+                            position -= op2.length
+                            continue
+                    else:
+                        continue
+                elif op1_type is DELETE:
+                    if op2_type is INSERT:
+                        if op2.position <= position:
+                            position += op2.content_len
+                            continue
+                    elif op2_type is DELETE:
+                        if op2.position + op2.length <= position:
+                            position -= op2.length
+                            continue
+                    else:
+                        continue
+                else:
+                    # Retains never conflict
+                    continue
+                
+                if position != current_op1.position:
+                    current_op1 = current_op1.with_position(position)
+                current_op1, transformed_ops2[i] = transform(current_op1, op2, priority)
+                position = current_op1.position
             
+            if position != current_op1.position:
+                current_op1 = current_op1.with_position(position)
             transformed_ops1.append(current_op1)
-            transformed_ops2 = temp_ops2
         
         return OTOperationSet(transformed_ops1), OTOperationSet(transformed_ops2)
 
@@ -464,7 +542,12 @@ class OTDiffGenerator:
     """
     
     @staticmethod
-    def generate_operations(old_text: str, new_text: str) -> OTOperationSet:
+    def generate_operations(
+        old_text: str,
+        new_text: str,
+        prefix_hint: int = 0,
+        suffix_hint: int = 0
+    ) -> OTOperationSet:
         """
         Generate OT operations to transform old_text into new_text.
         
@@ -472,96 +555,77 @@ class OTDiffGenerator:
         retain, delete, and insert operations. Operations work sequentially through
         the document without absolute positions.
         
+        The prefix/suffix hints only affect speed: each one is checked with a
+        single comparison and the scan resumes past it; a wrong hint is ignored.
+        
         Args:
             old_text: The original text
             new_text: The target text
+            prefix_hint: Length of a prefix the caller expects both texts to share
+            suffix_hint: Length of a suffix the caller expects both texts to share
             
         Returns:
             OTOperationSet containing sequential operations to transform old_text to new_text
         """
-        logger.info(f"OTDiffGenerator.generate_operations called")
-        logger.info(f"Old text: '{old_text}' (length: {len(old_text)})")
-        logger.info(f"New text: '{new_text}' (length: {len(new_text)})")
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(
+                "OTDiffGenerator.generate_operations: old length %d, new length %d",
+                len(old_text), len(new_text)
+            )
         
         operations = []
         
         if old_text == new_text:
-            logger.info("Texts are identical, generating retain operation")
             # No changes needed - just retain all content
             if old_text:
-                operations.append(OTOperation(OperationType.RETAIN, length=len(old_text)))
-            logger.info(f"Generated operations: {operations}")
+                operations.append(OTOperation(RETAIN, length=len(old_text)))
             return OTOperationSet(operations)
         
         old_len = len(old_text)
         new_len = len(new_text)
         
-        # Find common prefix
-        common_prefix = 0
-        while (common_prefix < old_len and 
-               common_prefix < new_len and 
-               old_text[common_prefix] == new_text[common_prefix]):
-            common_prefix += 1
-        
-        logger.info(f"Common prefix length: {common_prefix}")
-        if common_prefix > 0:
-            logger.info(f"Common prefix: '{old_text[:common_prefix]}'")
-        
-        # Find common suffix
-        common_suffix = 0
-        while (common_suffix < (old_len - common_prefix) and
-               common_suffix < (new_len - common_prefix) and
-               old_text[old_len - 1 - common_suffix] == new_text[new_len - 1 - common_suffix]):
-            common_suffix += 1
-        
-        logger.info(f"Common suffix length: {common_suffix}")
-        if common_suffix > 0:
-            logger.info(f"Common suffix: '{old_text[-common_suffix:]}'")
-        
-        # Calculate middle parts
-        old_middle = old_text[common_prefix:old_len - common_suffix]
-        new_middle = new_text[common_prefix:new_len - common_suffix]
-        logger.info(f"Old middle: '{old_middle}' (length: {len(old_middle)})")
-        logger.info(f"New middle: '{new_middle}' (length: {len(new_middle)})")
+        # Find common prefix and suffix (the suffix may not overlap the prefix)
+        prefix_hint = max(0, min(prefix_hint, old_len, new_len))
+        if prefix_hint and not old_text.startswith(new_text[:prefix_hint]):
+            prefix_hint = 0
+        common_prefix = _common_prefix_len(old_text, new_text, prefix_hint)
+        
+        suffix_limit = min(old_len, new_len) - common_prefix
+        suffix_hint = max(0, min(suffix_hint, suffix_limit))
+        if suffix_hint and not old_text.endswith(new_text[new_len - suffix_hint:]):
+            suffix_hint = 0
+        common_suffix = _common_suffix_len(old_text, new_text, suffix_limit, suffix_hint)
+        
+        if debug:
+            logger.debug(
+                "Common prefix length: %d, common suffix length: %d",
+                common_prefix, common_suffix
+            )
         
         # Generate sequential operations
         
         # 1. Retain the common prefix
         if common_prefix > 0:
-            retain_op = OTOperation(OperationType.RETAIN, length=common_prefix)
-            operations.append(retain_op)
-            logger.info(f"Added retain operation: {retain_op}")
+            operations.append(OTOperation(RETAIN, length=common_prefix))
         
         # 2. Delete the old middle part (characters that need to be removed)
         old_middle_len = old_len - common_prefix - common_suffix
         if old_middle_len > 0:
-            delete_op = OTOperation(OperationType.DELETE, length=old_middle_len)
-            operations.append(delete_op)
-            logger.info(f"Added delete operation: {delete_op}")
+            operations.append(OTOperation(DELETE, length=old_middle_len))
         
         # 3. Insert the new middle part (new characters to be added)
         new_middle = new_text[common_prefix:new_len - common_suffix]
         if new_middle:
-            insert_op = OTOperation(OperationType.INSERT, content=new_middle)
-            operations.append(insert_op)
-            logger.info(f"Added insert operation: {insert_op}")
+            operations.append(OTOperation(INSERT, content=new_middle))
         
         # 4. Retain the common suffix (if any)
         if common_suffix > 0:
-            suffix_retain_op = OTOperation(OperationType.RETAIN, length=common_suffix)
-            operations.append(suffix_retain_op)
-            logger.info(f"Added suffix retain operation: {suffix_retain_op}")
+            operations.append(OTOperation(RETAIN, length=common_suffix))
         
         operation_set = OTOperationSet(operations)
-        logger.info(f"Final operation set: {operation_set}")
-        
-        # Test the operations
-        try:
-            result = operation_set.apply(old_text)
-            logger.info(f"Test application result: '{result}'")
-            logger.info(f"Test successful: {result == new_text}")
-        except Exception as e:
-            logger.error(f"Test application failed: {e}")
+        if debug:
+            logger.debug("Generated operation set: %s", operation_set)
         
         return operation_set
     
@@ -582,16 +646,23 @@ class OTDiffGenerator:
         Args:
             old_text: The original text
             new_text: The target text  
-            cursor_position: Known cursor position (optional)
+            cursor_position: Cursor position in new_text after the edit (optional)
             
         Returns:
             OTOperationSet optimized for the detected change pattern
         """
-        # If cursor position is known, optimize around that area
-        if cursor_position is not None:
-            # Check if change is near cursor position
-            # This could be implemented to handle common editing scenarios
-            pass
-        
-        # For now, fall back to basic diff generation
-        return OTDiffGenerator.generate_operations(old_text, new_text)
\ No newline at end of file
+        if cursor_position is None:
+            return OTDiffGenerator.generate_operations(old_text, new_text)
+        
+        # The cursor sits right after a typed run or at a deletion point in
+        # new_text, so the edit is expected just before it. Hint a prefix and
+        # suffix that stop a small window short of the cursor; they're verified
+        # and the scan only has to cover the window around the edit.
+        new_len = len(new_text)
+        cursor_position = max(0, min(cursor_position, new_len))
+        return OTDiffGenerator.generate_operations(
+            old_text,
+            new_text,
+            prefix_hint=cursor_position - _CURSOR_WINDOW,
+            suffix_hint=new_len - cursor_position - _CURSOR_WINDOW
+        )
\ No newline at end of file
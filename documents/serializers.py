@@ -1,19 +1,151 @@
+import copy
 import logging
 from rest_framework import serializers
+from rest_framework.settings import api_settings
+from rest_framework.utils import html
 from django.contrib.auth.models import User
+from django.db.models import Value
+from django.db.models.functions import Coalesce, Concat, NullIf, Trim
 from .models import Document, DocumentChange
-from .services import DocumentService
+from .services import SEARCH_SNIPPET_LENGTH, DocumentService
 
 logger = logging.getLogger(__name__)
 
+# ModelSerializer.get_fields() result per serializer class; see
+# CachedFieldsModelSerializer
+_FIELDS_CACHE = {}
 
-class UserSerializer(serializers.ModelSerializer):
+
+class CachedFieldsModelSerializer(serializers.ModelSerializer):
+    """
+    ModelSerializer that builds its fields once per class.
+    
+    DRF re-runs model introspection and field construction in get_fields()
+    for every serializer instance, although the result only depends on the
+    class. The first instance's fields are kept as prototypes and later
+    instances get deep copies, which DRF then binds as usual. Field's
+    __deepcopy__ rebuilds each field from its constructor arguments, so
+    instances don't share validators lists or error_messages dicts.
+    Subclasses whose fields depend on the instance or context must not use
+    this base.
+    """
+
+    def get_fields(self):
+        cls = type(self)
+        fields = _FIELDS_CACHE.get(cls)
+        if fields is None:
+            fields = _FIELDS_CACHE[cls] = super().get_fields()
+        return copy.deepcopy(fields)
+
+
+def user_full_name(relation):
+    """
+    Expression for a related user's display name, computed in the database.
+    
+    Matches user.get_full_name() or user.username, and is NULL when the
+    relation is empty.
+    """
+    return Coalesce(
+        NullIf(
+            Trim(Concat(f"{relation}__first_name", Value(" "), f"{relation}__last_name")),
+            Value(""),
+        ),
+        f"{relation}__username",
+    )
+
+
+class UserNameField(serializers.Field):
+    """
+    Read-only display name of a related user.
+    
+    Uses the "<relation>_full_name" annotation when the object was loaded
+    through EagerLoadingMixin.annotate_user_names(), otherwise formats the
+    related user in Python.
+    """
+
+    def __init__(self, relation, **kwargs):
+        kwargs["read_only"] = True
+        kwargs["source"] = "*"
+        super().__init__(**kwargs)
+        self.relation = relation
+        self.annotation = f"{relation}_full_name"
+
+    def to_representation(self, instance):
+        try:
+            return getattr(instance, self.annotation)
+        except AttributeError:
+            pass
+        user = getattr(instance, self.relation)
+        if user is None:
+            return None
+        return user.get_full_name() or user.username
+
+
+class EagerLoadingMixin:
+    """
+    Serializer mixin that declares the relations its nested fields read.
+    
+    Views pass their querysets through setup_eager_loading() so those
+    relations are fetched with a JOIN instead of one query per row.
+    """
+
+    select_related_fields = ()
+    # Relations whose UserNameField can be filled from a query annotation
+    user_name_fields = ()
+    # Model columns the serializer never reads and the query can skip
+    deferred_fields = ()
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        if cls.select_related_fields:
+            queryset = queryset.select_related(*cls.select_related_fields)
+        if cls.deferred_fields:
+            queryset = queryset.defer(*cls.deferred_fields)
+        return queryset
+
+    @classmethod
+    def annotate_user_names(cls, queryset):
+        """
+        Compute user display names in the query.
+        
+        Only for read-only responses: the annotations are not refreshed when
+        the instance is modified and saved.
+        """
+        return queryset.annotate(**{
+            f"{relation}_full_name": user_full_name(relation)
+            for relation in cls.user_name_fields
+        })
+
+
+class UserSerializer(CachedFieldsModelSerializer):
     class Meta:
         model = User
         fields = ["id", "username", "first_name", "last_name"]
 
+    def to_representation(self, instance):
+        # Every field is a plain column whose value is already what DRF's
+        # IntegerField/CharField would output, so skip the per-field loop.
+        # Only add fields to Meta that keep this true.
+        return {name: getattr(instance, name) for name in self.Meta.fields}
+
+
+def values_projection(fields, nested):
+    """
+    Column names for QuerySet.values() that cover a serializer's fields.
+    
+    Each nested serializer in nested (field name -> serializer class) is
+    read through its relation as "<field>__<nested field>" columns.
+    """
+    columns = []
+    for name in fields:
+        if name in nested:
+            columns.extend(f"{name}__{sub}" for sub in nested[name].Meta.fields)
+        else:
+            columns.append(name)
+    return columns
+
 
-class DocumentListSerializer(serializers.ModelSerializer):
+class DocumentListSerializer(CachedFieldsModelSerializer):
     created_by = UserSerializer(read_only=True)
 
     class Meta:
@@ -28,13 +160,58 @@ class DocumentListSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ["id", "version", "created_at", "updated_at", "created_by"]
 
+    # The list endpoint reads rows with QuerySet.values(*values_fields), so
+    # they're projected straight from the cursor without model instances
+    nested_values = {"created_by": UserSerializer}
+    values_fields = values_projection(Meta.fields, nested_values)
+
+    def represent_values(self, rows):
+        """
+        Represent rows from values(*values_fields) the way to_representation()
+        represents Document instances.
+        """
+        fields = self.fields
+        nested_columns = {
+            name: [(sub, f"{name}__{sub}") for sub in serializer.Meta.fields]
+            for name, serializer in self.nested_values.items()
+        }
+        # Nested values are plain columns, already in their output form
+        # (see UserSerializer.to_representation); other fields convert theirs
+        plan = [
+            (name, nested_columns.get(name), fields[name].to_representation)
+            for name in self.Meta.fields
+        ]
+        # Rows usually share a handful of nested objects; build each once
+        nested_cache = {}
+
+        data = []
+        for row in rows:
+            item = {}
+            for name, columns, to_representation in plan:
+                if columns is None:
+                    value = row[name]
+                    item[name] = None if value is None else to_representation(value)
+                    continue
+                key = (name, *[row[column] for _, column in columns])
+                nested = nested_cache.get(key)
+                if nested is None:
+                    nested = nested_cache[key] = {sub: row[column] for sub, column in columns}
+                item[name] = nested
+            data.append(item)
+        return data
+
 
-class DocumentSerializer(serializers.ModelSerializer):
+class DocumentSerializer(EagerLoadingMixin, CachedFieldsModelSerializer):
     created_by = UserSerializer(read_only=True)
     last_modified_by = UserSerializer(read_only=True)
     etag = serializers.CharField(read_only=True)
-    created_by_name = serializers.SerializerMethodField()
-    last_modified_by_name = serializers.SerializerMethodField()
+    created_by_name = UserNameField("created_by")
+    last_modified_by_name = UserNameField("last_modified_by")
+
+    select_related_fields = ("created_by", "last_modified_by")
+    user_name_fields = ("created_by", "last_modified_by")
+    # The tsvector is about as large as the content and only used by search
+    deferred_fields = ("search_vector",)
 
     class Meta:
         model = Document
@@ -61,14 +238,6 @@ class DocumentSerializer(serializers.ModelSerializer):
             "last_modified_by",
         ]
 
-    def get_created_by_name(self, obj):
-        return obj.created_by.get_full_name() or obj.created_by.username
-
-    def get_last_modified_by_name(self, obj):
-        if obj.last_modified_by:
-            return obj.last_modified_by.get_full_name() or obj.last_modified_by.username
-        return None
-
     def validate_content(self, value):
         # Content is now plain text, no validation needed
         return value
@@ -95,11 +264,12 @@ class DocumentCreateSerializer(serializers.ModelSerializer):
         fields = ["title", "content"]
 
     def validate_title(self, value):
-        if not value.strip():
+        title = value.strip()
+        if not title:
             raise serializers.ValidationError("Title cannot be empty.")
-        if len(value) > 255:
+        if len(title) > 255:
             raise serializers.ValidationError("Title cannot exceed 255 characters.")
-        return value.strip()
+        return title
 
     def validate_content(self, value):
         # Content is now plain text, no validation needed
@@ -117,6 +287,29 @@ class DocumentCreateSerializer(serializers.ModelSerializer):
         )
 
 
+def _validate_insert_operation(data):
+    # Insert operation needs content
+    if "content" not in data:
+        raise serializers.ValidationError("insert operation requires 'content' field")
+    
+    content = data["content"]
+    if not isinstance(content, str):
+        raise serializers.ValidationError("Content must be a string")
+    
+    if len(content) == 0:
+        raise serializers.ValidationError("Insert content cannot be empty")
+
+
+def _validate_length_operation(data):
+    # Delete and retain operations need length
+    if "length" not in data:
+        raise serializers.ValidationError(f"{data['operation']} operation requires 'length' field")
+    
+    length = data["length"]
+    if not isinstance(length, int) or length <= 0:
+        raise serializers.ValidationError("Length must be a positive integer")
+
+
 class ChangeOperationSerializer(serializers.Serializer):
     """Serializer for sequential Operational Transform operations."""
 
@@ -125,73 +318,122 @@ class ChangeOperationSerializer(serializers.Serializer):
     content = serializers.CharField(required=False, allow_blank=True, trim_whitespace=False)
     length = serializers.IntegerField(required=False)
 
+    # Per-operation checks, looked up once instead of walking an if/elif chain
+    _OP_VALIDATORS = {
+        "insert": _validate_insert_operation,
+        "delete": _validate_length_operation,
+        "retain": _validate_length_operation,
+    }
+
     def validate(self, data):
         operation = data.get("operation")
-        logger.info(f"Validating operation: {operation} with data: {data}")
+        logger.debug("Validating operation: %s with data: %s", operation, data)
         
-        # Handle sequential OT operations
-        if operation in ["retain", "insert", "delete"]:
-            result = self._validate_sequential_ot_operation(data)
-            logger.info(f"Operation validation passed for {operation}")
-            return result
-        else:
-            logger.error(f"Unsupported operation: {operation}")
+        validator = self._OP_VALIDATORS.get(operation)
+        if validator is None:
+            logger.error("Unsupported operation: %s", operation)
             raise serializers.ValidationError(
                 f"Unsupported operation: {operation}. "
                 f"Supported operations: 'retain', 'insert', 'delete'"
             )
+        validator(data)
+        return data
+
+
+def _is_plain_text(value):
+    """True if DRF's CharField would accept value as is (no NUL or surrogates)."""
+    if "\x00" in value:
+        return False
+    try:
+        value.encode("utf-8")
+    except UnicodeEncodeError:
+        return False
+    return True
+
+
+class ChangeOperationListField(serializers.ListField):
+    """
+    List of sequential OT operations, validated in a single pass.
     
-    def _validate_sequential_ot_operation(self, data):
-        """Validate sequential OT operations (retain, insert, delete)."""
-        operation = data.get("operation")
-        
+    Equivalent to ChangeOperationSerializer(many=True): the same validated
+    data and the same per-item error layout. Operations that are already in
+    canonical form (string operation and content, int length) are checked
+    inline; anything else goes through ChangeOperationSerializer so DRF's
+    coercion and messages apply unchanged.
+    """
+
+    def to_internal_value(self, data):
+        if html.is_html_input(data):
+            data = html.parse_html_list(data, default=[])
+        if not isinstance(data, list):
+            # Same detail layout as ListSerializer
+            message = self.error_messages["not_a_list"].format(input_type=type(data).__name__)
+            raise serializers.ValidationError(
+                {api_settings.NON_FIELD_ERRORS_KEY: [message]}, code="not_a_list"
+            )
+
+        operation_serializer = None
+        validated = []
+        errors = []
+        has_errors = False
+
+        for item in data:
+            change = self._validate_canonical(item) if isinstance(item, dict) else None
+            if change is None:
+                if operation_serializer is None:
+                    operation_serializer = ChangeOperationSerializer()
+                try:
+                    change = operation_serializer.run_validation(item)
+                except serializers.ValidationError as exc:
+                    errors.append(exc.detail)
+                    has_errors = True
+                    continue
+            validated.append(change)
+            errors.append({})
+
+        if has_errors:
+            raise serializers.ValidationError(errors)
+        return validated
+
+    @staticmethod
+    def _validate_canonical(item):
+        """Validated operation, or None if item needs full serializer validation."""
+        operation = item.get("operation")
+        if type(operation) is not str or operation not in ("retain", "insert", "delete"):
+            return None
+
+        change = {"operation": operation}
+        if "content" in item:
+            content = item["content"]
+            if type(content) is not str or not _is_plain_text(content):
+                return None
+            change["content"] = content
+        if "length" in item:
+            length = item["length"]
+            if type(length) is not int:
+                return None
+            change["length"] = length
+
         if operation == "insert":
-            # Insert operation needs content
-            if "content" not in data:
-                raise serializers.ValidationError("insert operation requires 'content' field")
-            
-            content = data["content"]
-            if not isinstance(content, str):
-                raise serializers.ValidationError("Content must be a string")
-            
-            if len(content) == 0:
-                raise serializers.ValidationError("Insert content cannot be empty")
-        
-        elif operation == "delete":
-            # Delete operation needs length
-            if "length" not in data:
-                raise serializers.ValidationError("delete operation requires 'length' field")
-            
-            length = data["length"]
-            if not isinstance(length, int) or length <= 0:
-                raise serializers.ValidationError("Length must be a positive integer")
-        
-        elif operation == "retain":
-            # Retain operation needs length
-            if "length" not in data:
-                raise serializers.ValidationError("retain operation requires 'length' field")
-            
-            length = data["length"]
-            if not isinstance(length, int) or length <= 0:
-                raise serializers.ValidationError("Length must be a positive integer")
-        
-        return data
+            if not change.get("content"):
+                return None
+        elif change.get("length", 0) <= 0:
+            return None
+        return change
 
 
 class DocumentChangeSerializer(serializers.Serializer):
     """Serializer for applying changes to a document."""
 
     version = serializers.IntegerField()
-    changes = ChangeOperationSerializer(many=True)
+    changes = ChangeOperationListField()
 
     def validate(self, data):
-        logger.info(f"DocumentChangeSerializer validating data: {data}")
-        
         if not data.get("changes"):
             logger.error("No changes provided in DocumentChangeSerializer")
             raise serializers.ValidationError("At least one change is required")
         
-        logger.info(f"DocumentChangeSerializer validation passed with {len(data.get('changes', []))} changes")
+        logger.info("DocumentChangeSerializer validation passed with %d changes", len(data["changes"]))
         return data
 
     def update(self, instance, validated_data):
@@ -200,8 +442,13 @@ class DocumentChangeSerializer(serializers.Serializer):
         changes = validated_data["changes"]
         user = self.context["request"].user
 
-        logger.info(f"DocumentChangeSerializer applying {len(changes)} changes to document {instance.id}")
-        logger.info(f"Expected version: {expected_version}, current version: {instance.version}")
+        logger.info(
+            "DocumentChangeSerializer applying %d changes to document %s",
+            len(changes), instance.id,
+        )
+        logger.info(
+            "Expected version: %s, current version: %s", expected_version, instance.version
+        )
 
         return DocumentService.apply_changes(
             document=instance,
@@ -211,11 +458,14 @@ class DocumentChangeSerializer(serializers.Serializer):
         )
 
 
-class DocumentChangeHistorySerializer(serializers.ModelSerializer):
+class DocumentChangeHistorySerializer(EagerLoadingMixin, CachedFieldsModelSerializer):
     """Serializer for document change history."""
 
     applied_by = UserSerializer(read_only=True)
-    applied_by_name = serializers.SerializerMethodField()
+    applied_by_name = UserNameField("applied_by")
+
+    select_related_fields = ("applied_by",)
+    user_name_fields = ("applied_by",)
 
     class Meta:
         model = DocumentChange
@@ -229,14 +479,11 @@ class DocumentChangeHistorySerializer(serializers.ModelSerializer):
             "to_version",
         ]
 
-    def get_applied_by_name(self, obj):
-        return obj.applied_by.get_full_name() or obj.applied_by.username
-
 
 class DocumentSearchResultSerializer(serializers.ModelSerializer):
     """Serializer for document search results with lightweight data and snippets."""
     
-    created_by_name = serializers.SerializerMethodField()
+    created_by_name = UserNameField("created_by")
     content_snippet = serializers.SerializerMethodField()
     search_rank = serializers.FloatField(source='rank', read_only=True)
     
@@ -253,18 +500,17 @@ class DocumentSearchResultSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ["id", "title", "updated_at", "version"]
     
-    def get_created_by_name(self, obj):
-        """Get the full name or username of the document creator."""
-        return obj.created_by.get_full_name() or obj.created_by.username
-    
     def get_content_snippet(self, obj):
         """Extract a content snippet for search results (first 200 characters)."""
-        plain_text = obj.content or ""
-        if len(plain_text) <= 200:
+        # search_documents() only loads the start of the content
+        plain_text = getattr(obj, "content_head", None)
+        if plain_text is None:
+            plain_text = obj.content or ""
+        if len(plain_text) <= SEARCH_SNIPPET_LENGTH:
             return plain_text
         
         # Find a good breaking point near 200 characters
-        snippet = plain_text[:200]
+        snippet = plain_text[:SEARCH_SNIPPET_LENGTH]
         
         # Try to break at word boundary
         last_space = snippet.rfind(' ')
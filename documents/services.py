@@ -1,17 +1,46 @@
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional
+from django.conf import settings
 from django.contrib.auth.models import User
+from django.contrib.postgres.lookups import TrigramSimilar
 from django.contrib.postgres.search import SearchQuery, SearchRank
 from django.db import transaction
-from django.db.models import Q
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+from django.db.models import Count, F, Q, Window
+from django.db.models.functions import Substr
+from django.utils import timezone
 from .models import Document, DocumentChange
 # No utility imports needed - working directly with plain text
 from .exceptions import VersionConflictError, InvalidChangeError
 from .operational_transforms import OTOperation, OTOperationSet, OperationType
+import copy
 import logging
+import threading
 import time
+from collections import OrderedDict
 
 logger = logging.getLogger(__name__)
 
+# Columns every edit writes besides the edited title/content. Saving only
+# these keeps the rest of the row, notably the stored search vector, out of
+# the UPDATE sent for each edit.
+EDIT_UPDATE_FIELDS = ["last_modified_by", "version", "updated_at"]
+
+# Characters of content shown as a search result snippet. Search fetches one
+# more than this, so the snippet can tell whether the content was cut.
+SEARCH_SNIPPET_LENGTH = 200
+
+# Rows fetched per round trip when streaming a document's change history
+CHANGE_HISTORY_CHUNK_SIZE = 200
+
+# Change operation name -> (OT operation type, whether it carries content
+# rather than a length), so conversion is one lookup per operation
+_CHANGE_OPERATIONS = {
+    "retain": (OperationType.RETAIN, False),
+    "insert": (OperationType.INSERT, True),
+    "delete": (OperationType.DELETE, False),
+}
+
 
 class DocumentService:
     """
@@ -21,6 +50,98 @@ class DocumentService:
     for document creation, updates, and change tracking.
     """
 
+    # Owner of documents created without a logged-in user, resolved once
+    # per process by get_anonymous_user()
+    _anonymous_user: Optional[User] = None
+
+    # Text produced by recent previews, keyed by _preview_key(), so applying
+    # the previewed changes right after doesn't redo the OT work. Entries are
+    # dropped once applied, and only the most recent few are kept, up to
+    # PREVIEW_RESULTS_MAX_CHARS of text in all. Larger texts aren't kept.
+    _preview_results: "OrderedDict[tuple, str]" = OrderedDict()
+    _preview_results_lock = threading.Lock()
+    PREVIEW_RESULTS_SIZE = 16
+    PREVIEW_RESULTS_MAX_CHARS = 1_000_000
+
+    @staticmethod
+    def get_anonymous_user() -> User:
+        """
+        Get the shared "anonymous" user, creating it on first use.
+        
+        The user is looked up once and cached for the life of the process, so
+        anonymous writes don't pay an extra query each. It is only cached once
+        the transaction that looked it up commits, so a user created in a
+        transaction that is rolled back is never cached, and deleting the
+        user clears the cache. Callers get a copy so they can't modify the
+        cached instance.
+        
+        Returns:
+            User: The anonymous user
+        """
+        cached = DocumentService._anonymous_user
+        if cached is not None:
+            return copy.copy(cached)
+
+        user, _ = User.objects.get_or_create(
+            username="anonymous",
+            defaults={
+                "first_name": "Anonymous",
+                "last_name": "User",
+                "email": "anonymous@example.com",
+            },
+        )
+
+        def remember():
+            DocumentService._anonymous_user = user
+
+        # Runs right away outside a transaction
+        transaction.on_commit(remember)
+        return copy.copy(user)
+
+    @staticmethod
+    def _preview_key(document: Document, changes: List[Dict[str, Any]]) -> Optional[tuple]:
+        """
+        Cache key for previewing changes on this document state, if changes can be keyed.
+        
+        Only the field each operation uses is keyed, so the raw changes a
+        preview gets and the validated changes apply_changes() gets produce
+        the same key even if the request carried extra keys.
+        """
+        try:
+            changes_key = tuple(
+                (
+                    change["operation"],
+                    change.get("content") if change["operation"] == "insert" else change.get("length"),
+                )
+                for change in changes
+            )
+            hash(changes_key)
+        except (TypeError, KeyError):
+            return None
+        # The version and content hash pin the text the changes were applied to
+        return (document.pk, document.version, document.current_content_hash, changes_key)
+
+    @staticmethod
+    def _remember_preview(key: Optional[tuple], preview_text: str) -> None:
+        if key is None or len(preview_text) > DocumentService.PREVIEW_RESULTS_MAX_CHARS:
+            return
+        with DocumentService._preview_results_lock:
+            results = DocumentService._preview_results
+            results[key] = preview_text
+            results.move_to_end(key)
+            while (
+                len(results) > DocumentService.PREVIEW_RESULTS_SIZE
+                or sum(map(len, results.values())) > DocumentService.PREVIEW_RESULTS_MAX_CHARS
+            ):
+                results.popitem(last=False)
+
+    @staticmethod
+    def _take_preview(key: Optional[tuple]) -> Optional[str]:
+        if key is None:
+            return None
+        with DocumentService._preview_results_lock:
+            return DocumentService._preview_results.pop(key, None)
+
     @staticmethod
     def _convert_changes_to_ot_operations(changes: List[Dict[str, Any]]) -> List[OTOperation]:
         """
@@ -32,49 +153,53 @@ class DocumentService:
         Returns:
             List of OTOperation objects
             
+        Raises:
+            InvalidChangeError: If operations are invalid
+        """
+        ot_operations = list(DocumentService._iter_ot_operations(changes))
+        logger.info("Converted %d operations to OT operations", len(changes))
+        return ot_operations
+
+    @staticmethod
+    def _iter_ot_operations(changes: List[Dict[str, Any]]) -> Iterator[OTOperation]:
+        """
+        Convert operation dictionaries to OTOperation objects one at a time.
+        
+        Lets callers that only apply the operations once stream them into
+        OTOperationSet.apply_operations() without building a list. Errors
+        are raised when the invalid operation is reached.
+        
         Raises:
             InvalidChangeError: If operations are invalid
         """
         if not changes:
             raise InvalidChangeError("At least one operation is required")
         
-        ot_operations = []
-        
-        for i, change in enumerate(changes):
+        for i, change in enumerate(changes, 1):
             if not isinstance(change, dict):
-                raise InvalidChangeError(f"Operation {i+1} must be a dictionary")
+                raise InvalidChangeError(f"Operation {i} must be a dictionary")
                 
             operation = change.get("operation")
-            if operation not in ["retain", "insert", "delete"]:
+            spec = _CHANGE_OPERATIONS.get(operation) if isinstance(operation, str) else None
+            if spec is None:
                 raise InvalidChangeError(
-                    f"Operation {i+1}: Unsupported operation '{operation}'. "
+                    f"Operation {i}: Unsupported operation '{operation}'. "
                     f"Supported operations: 'retain', 'insert', 'delete'"
                 )
             
-            try:
-                if operation == "retain":
-                    length = change.get("length")
-                    if not isinstance(length, int) or length <= 0:
-                        raise InvalidChangeError(f"Operation {i+1}: Retain operation requires positive length")
-                    ot_operations.append(OTOperation(OperationType.RETAIN, length=length))
-                    
-                elif operation == "insert":
-                    content = change.get("content")
-                    if not isinstance(content, str) or len(content) == 0:
-                        raise InvalidChangeError(f"Operation {i+1}: Insert operation requires non-empty content")
-                    ot_operations.append(OTOperation(OperationType.INSERT, content=content))
-                    
-                elif operation == "delete":
-                    length = change.get("length")
-                    if not isinstance(length, int) or length <= 0:
-                        raise InvalidChangeError(f"Operation {i+1}: Delete operation requires positive length")
-                    ot_operations.append(OTOperation(OperationType.DELETE, length=length))
-                    
-            except Exception as e:
-                raise InvalidChangeError(f"Operation {i+1}: {str(e)}")
-        
-        logger.info(f"Converted {len(changes)} operations to OT operations")
-        return ot_operations
+            op_type, takes_content = spec
+            if takes_content:
+                content = change.get("content")
+                if not isinstance(content, str) or not content:
+                    raise InvalidChangeError(f"Operation {i}: Insert operation requires non-empty content")
+                yield OTOperation(op_type, content=content)
+            else:
+                length = change.get("length")
+                if not isinstance(length, int) or length <= 0:
+                    raise InvalidChangeError(
+                        f"Operation {i}: {operation.capitalize()} operation requires positive length"
+                    )
+                yield OTOperation(op_type, length=length)
 
     @staticmethod
     def create_document(
@@ -102,38 +227,95 @@ class DocumentService:
 
         # Handle user assignment
         if not user or not user.is_authenticated:
-            # Create or get anonymous user
-            user, _ = User.objects.get_or_create(
-                username="anonymous",
-                defaults={
-                    "first_name": "Anonymous",
-                    "last_name": "User",
-                    "email": "anonymous@example.com",
-                },
-            )
+            user = DocumentService.get_anonymous_user()
 
         # Handle content - just use the plain text directly
         final_content = content_text.strip() if content_text else ""
 
-        # Create document
-        document = Document.objects.create(
-            title=title,
-            content=final_content,
-            created_by=user,
-            last_modified_by=user,
-        )
+        # One transaction for both rows: a single commit instead of one per
+        # INSERT, and no document is left without its initial change record
+        with transaction.atomic():
+            # Create document
+            document = Document.objects.create(
+                title=title,
+                content=final_content,
+                created_by=user,
+                last_modified_by=user,
+            )
 
-        # Create initial change record
-        DocumentChange.objects.create(
-            document=document,
-            change_data={"operation": "create", "initial_content": True},
-            applied_by=user,
-            from_version=0,
-            to_version=document.version,
-        )
+            # Create initial change record
+            DocumentChange.objects.create(
+                document=document,
+                change_data={"operation": "create", "initial_content": True},
+                applied_by=user,
+                from_version=0,
+                to_version=document.version,
+            )
 
         return document
 
+    @staticmethod
+    def create_documents_bulk(
+        documents: List[Dict[str, Any]],
+        user: Optional[User] = None
+    ) -> List[Document]:
+        """
+        Create many documents with plain text content in a few INSERTs.
+        
+        Validation and the initial change records match create_document(),
+        but documents and change records are each inserted with bulk_create.
+        
+        Args:
+            documents: Dicts with a "title" and an optional "content"
+            user: User creating the documents (uses anonymous user if None)
+            
+        Returns:
+            List[Document]: The created documents, in input order
+        """
+        if not user or not user.is_authenticated:
+            user = DocumentService.get_anonymous_user()
+
+        new_documents = []
+        for data in documents:
+            title = data.get("title")
+            if not title or not title.strip():
+                raise ValueError("Title cannot be empty")
+
+            title = title.strip()
+            if len(title) > 255:
+                raise ValueError("Title cannot exceed 255 characters")
+
+            content_text = data.get("content")
+            final_content = content_text.strip() if content_text else ""
+            document = Document(
+                title=title,
+                content=final_content,
+                created_by=user,
+                last_modified_by=user,
+            )
+            # bulk_create skips Document.save(), which normally fills the hash
+            document.set_content_hash()
+            new_documents.append(document)
+
+        batch_size = settings.BULK_CREATE_BATCH_SIZE
+        with transaction.atomic():
+            Document.objects.bulk_create(new_documents, batch_size=batch_size)
+            DocumentChange.objects.bulk_create(
+                [
+                    DocumentChange(
+                        document=document,
+                        change_data={"operation": "create", "initial_content": True},
+                        applied_by=user,
+                        from_version=0,
+                        to_version=document.version,
+                    )
+                    for document in new_documents
+                ],
+                batch_size=batch_size,
+            )
+
+        return new_documents
+
     @staticmethod
     def update_document(
         document: Document,
@@ -164,54 +346,67 @@ class DocumentService:
                 f"Version conflict: expected {expected_version}, got {document.version}"
             )
 
-        changes_made = False
-        original_title = document.title
-        original_content = document.content
+        # Fields actually edited, so an unchanged (possibly large) content
+        # isn't sent back to the database with a title change. The change
+        # record describes exactly these fields.
+        dirty_fields = []
+        change_data = {}
+
+        # Update title if provided
+        if title is not None:
+            title = title.strip()
+            if not title:
+                raise ValueError("Title cannot be empty")
+            if len(title) > 255:
+                raise ValueError("Title cannot exceed 255 characters")
+            if title != document.title:
+                change_data["title_change"] = {
+                    "from": document.title,
+                    "to": title
+                }
+                document.title = title
+                dirty_fields.append("title")
+
+        # Update content if provided
+        if content_text is not None:
+            new_content = content_text.strip()
+            if new_content != document.content:
+                change_data["content_change"] = {
+                    "operation": "update", 
+                    "via": "text"
+                }
+                document.content = new_content
+                dirty_fields.append("content")
+
+        # Nothing to write, not even an empty change record: don't open a
+        # transaction at all
+        if not dirty_fields:
+            return document
 
         with transaction.atomic():
-            # Update title if provided
-            if title is not None:
-                title = title.strip()
-                if not title:
-                    raise ValueError("Title cannot be empty")
-                if len(title) > 255:
-                    raise ValueError("Title cannot exceed 255 characters")
-                if title != document.title:
-                    document.title = title
-                    changes_made = True
-
-            # Update content if provided
-            if content_text is not None:
-                new_content = content_text.strip()
-                if new_content != document.content:
-                    document.content = new_content
-                    changes_made = True
-
-            if changes_made:
+            if expected_version is None:
                 document.last_modified_by = user
-                document.save()
-
-                # Create change record
-                change_data = {}
-                if title is not None and title != original_title:
-                    change_data["title_change"] = {
-                        "from": original_title,
-                        "to": document.title
-                    }
-                if content_text is not None and document.content != original_content:
-                    change_data["content_change"] = {
-                        "operation": "update", 
-                        "via": "text"
-                    }
-
-                DocumentChange.objects.create(
-                    document=document,
-                    change_data=change_data,
-                    applied_by=user,
-                    from_version=document.version - 1,
-                    to_version=document.version,
+                document.save(update_fields=[*dirty_fields, *EDIT_UPDATE_FIELDS])
+            else:
+                # Check the version in the UPDATE itself, so an edit that
+                # lands after the check above is a conflict, not overwritten
+                DocumentService._update_if_version(
+                    document,
+                    expected_version,
+                    last_modified_by=user,
+                    version=expected_version + 1,
+                    **{field: getattr(document, field) for field in dirty_fields},
                 )
 
+            # Create change record
+            DocumentChange.objects.create(
+                document=document,
+                change_data=change_data,
+                applied_by=user,
+                from_version=document.version - 1,
+                to_version=document.version,
+            )
+
         return document
 
     @staticmethod
@@ -224,6 +419,12 @@ class DocumentService:
         """
         Apply structured changes to a document with change tracking.
         
+        Concurrency is optimistic: no row lock is held while the operations
+        are applied. The version is checked up front to fail fast, and again
+        in the UPDATE that stores the result (see _update_if_version()), so a
+        concurrent edit is reported rather than overwritten and the recorded
+        from_version/to_version always describe the write that happened.
+        
         Args:
             document: Document to modify
             changes: List of change operations
@@ -232,6 +433,10 @@ class DocumentService:
             
         Returns:
             Document: The updated document
+            
+        Raises:
+            VersionConflictError: If the document is not at expected_version
+            InvalidChangeError: If the changes can't be applied
         """
         if not user:
             raise ValueError("User is required for applying changes")
@@ -248,35 +453,163 @@ class DocumentService:
         # Get current plain text (content is already plain text)
         original_text = document.content
 
-        # Apply changes using OT operations
-        try:
-            logger.info(f"DocumentService.apply_changes: Converting {len(changes)} operations")
-            ot_operations = DocumentService._convert_changes_to_ot_operations(changes)
-            operation_set = OTOperationSet(ot_operations)
+        # A preview of the same changes on this version already did the work
+        new_text = DocumentService._take_preview(DocumentService._preview_key(document, changes))
+        if new_text is not None:
+            logger.info("DocumentService.apply_changes: Using previewed result")
+        else:
+            # Apply changes using OT operations
+            try:
+                logger.info("DocumentService.apply_changes: Converting %d operations", len(changes))
+                # Log lengths only: interpolating the document text copies and
+                # writes the whole document twice per request at INFO level
+                logger.info("Applying OT operations to text of length %d", len(original_text))
+                new_text = OTOperationSet.apply_operations(
+                    original_text, DocumentService._iter_ot_operations(changes)
+                )
+                logger.info("OT result length: %d", len(new_text))
+            except Exception as e:
+                logger.error(f"Failed to apply changes: {str(e)}")
+                raise InvalidChangeError(f"Failed to apply changes: {str(e)}")
+
+        # Only content changes here, so the version bump Document.save() would
+        # work out with an extra SELECT is known up front
+        new_version = expected_version + 1 if new_text != original_text else expected_version
+
+        DocumentService._write_applied_changes(
+            document,
+            new_text,
+            user,
+            expected_version,
+            new_version,
+            [
+                DocumentChange(
+                    document=document,
+                    change_data=changes,
+                    applied_by=user,
+                    from_version=expected_version,
+                    to_version=new_version,
+                )
+            ],
+        )
+        return document
+
+    @staticmethod
+    def apply_changes_bulk(
+        document: Document,
+        change_batches: List[List[Dict[str, Any]]],
+        user: User,
+        expected_version: int
+    ) -> Document:
+        """
+        Apply several batches of changes, such as queued autosaves, in one write.
+        
+        The result is the same as calling apply_changes() once per batch, each
+        batch recorded as its own DocumentChange, but the document is updated
+        with a single UPDATE and the change records are inserted with
+        bulk_create.
+        
+        Args:
+            document: Document to modify
+            change_batches: Lists of change operations, applied in order
+            user: User applying the changes
+            expected_version: Expected current version
             
-            logger.info(f"Applying OT operations to text: '{original_text}' (length: {len(original_text)})")
-            new_text = operation_set.apply(original_text)
-            logger.info(f"OT result: '{new_text}' (length: {len(new_text)})")
+        Returns:
+            Document: The updated document
+        """
+        if not user:
+            raise ValueError("User is required for applying changes")
+
+        if not change_batches or not all(change_batches):
+            raise ValueError("At least one change is required")
+
+        if document.version != expected_version:
+            raise VersionConflictError(
+                f"Version conflict: expected {expected_version}, got {document.version}"
+            )
+
+        text = document.content
+        version = expected_version
+        change_records = []
+        try:
+            logger.info("DocumentService.apply_changes_bulk: Applying %d batches", len(change_batches))
+            for changes in change_batches:
+                new_text = OTOperationSet.apply_operations(
+                    text, DocumentService._iter_ot_operations(changes)
+                )
+                new_version = version + 1 if new_text != text else version
+                change_records.append(
+                    DocumentChange(
+                        document=document,
+                        change_data=changes,
+                        applied_by=user,
+                        from_version=version,
+                        to_version=new_version,
+                    )
+                )
+                text, version = new_text, new_version
         except Exception as e:
             logger.error(f"Failed to apply changes: {str(e)}")
             raise InvalidChangeError(f"Failed to apply changes: {str(e)}")
 
+        DocumentService._write_applied_changes(
+            document, text, user, expected_version, version, change_records
+        )
+        return document
+
+    @staticmethod
+    def _write_applied_changes(
+        document: Document,
+        new_text: str,
+        user: User,
+        expected_version: int,
+        new_version: int,
+        change_records: List[DocumentChange]
+    ) -> None:
+        """Store the new text and its change records if the version still matches."""
         with transaction.atomic():
-            # Update document content directly with plain text
-            document.content = new_text
-            document.last_modified_by = user
-            document.save()
+            DocumentService._update_if_version(
+                document,
+                expected_version,
+                content=new_text,
+                last_modified_by=user,
+                version=new_version,
+            )
 
-            # Record the change
-            DocumentChange.objects.create(
-                document=document,
-                change_data=changes,
-                applied_by=user,
-                from_version=expected_version,
-                to_version=document.version,
+            # Record the changes
+            DocumentChange.objects.bulk_create(
+                change_records, batch_size=settings.BULK_CREATE_BATCH_SIZE
             )
 
-        return document
+    @staticmethod
+    def _update_if_version(document: Document, expected_version: int, **values: Any) -> None:
+        """
+        Write values to the document row in one UPDATE, if the stored version
+        still matches.
+        
+        This is a compare-and-swap on the version: a concurrent edit committed
+        since the document was read makes the UPDATE match no rows. The
+        instance is only updated once the write succeeded.
+        
+        Raises:
+            VersionConflictError: If the stored version is not expected_version
+        """
+        if "content" in values:
+            values["content_hash"] = Document.compute_content_hash(values["content"])
+        values["updated_at"] = timezone.now()
+
+        updated = Document.objects.filter(pk=document.pk, version=expected_version).update(**values)
+        if not updated:
+            raise VersionConflictError(
+                f"Version conflict: expected {expected_version}, "
+                f"document was modified concurrently"
+            )
+
+        for field, value in values.items():
+            setattr(document, field, value)
+        if "content" in values:
+            document.set_content_hash(values["content_hash"])
 
     @staticmethod
     def preview_changes(
@@ -297,16 +630,19 @@ class DocumentService:
             raise ValueError("No changes provided")
 
         try:
-            logger.info(f"DocumentService.preview_changes: Converting {len(changes)} operations")
+            logger.info("DocumentService.preview_changes: Converting %d operations", len(changes))
             ot_operations = DocumentService._convert_changes_to_ot_operations(changes)
             operation_set = OTOperationSet(ot_operations)
             
             original_text = document.content
-            logger.info(f"Previewing OT operations on text: '{original_text}' (length: {len(original_text)})")
+            logger.info("Previewing OT operations on text of length %d", len(original_text))
             
             # Apply operations to get preview result
             preview_text = operation_set.apply(original_text)
-            logger.info(f"Preview result: '{preview_text}' (length: {len(preview_text)})")
+            logger.info("Preview result length: %d", len(preview_text))
+            DocumentService._remember_preview(
+                DocumentService._preview_key(document, changes), preview_text
+            )
             
             preview_result = {
                 "original_text": original_text,
@@ -325,20 +661,35 @@ class DocumentService:
             raise InvalidChangeError(f"Preview failed: {str(e)}")
 
     @staticmethod
-    def get_change_history(document: Document, limit: Optional[int] = None):
+    def get_change_history(
+        document: Document,
+        limit: Optional[int] = None,
+        stream: bool = False
+    ):
         """
         Get change history for a document.
         
         Args:
             document: Document to get history for
             limit: Maximum number of changes to return (optional)
+            stream: If True, iterate over the changes in chunks without
+                loading change_data, so long histories don't have to fit in
+                memory. For exports and scans that only need the version
+                and author columns.
             
         Returns:
-            QuerySet: DocumentChange objects for the document
+            QuerySet: DocumentChange objects for the document, or an
+            iterator over them when streaming. Streamed changes have
+            change_data deferred: reading it runs one query per change,
+            so callers that render change_data should not stream.
         """
         queryset = document.changes.all()
+        if stream:
+            queryset = queryset.select_related("applied_by").defer("change_data")
         if limit:
             queryset = queryset[:limit]
+        if stream:
+            return queryset.iterator(chunk_size=CHANGE_HISTORY_CHUNK_SIZE)
         return queryset
 
     @staticmethod
@@ -358,14 +709,15 @@ class DocumentService:
             user_only: If True, search only the user's documents
             
         Returns:
-            Dict containing search results and metadata
+            Dict containing search results and metadata; "documents" is
+            always a list of Document instances
         """
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
         # Handle empty query
         if not query or not query.strip():
             return {
-                "documents": Document.objects.none(),
+                "documents": [],
                 "query": query,
                 "total_results": 0,
                 "search_time": 0,
@@ -377,13 +729,24 @@ class DocumentService:
         # Create search query and ranking
         search_query = SearchQuery(query)
         
-        # Base queryset with search filtering and ranking
+        # Rank against the stored vector. Passing the field name would wrap it
+        # in SearchVector and re-tokenize the vector's text for every row.
+        matches = Q(search_vector=search_query)
+        relevant = Q(rank__gt=0)  # Only include documents with positive relevance
+        if settings.SEARCH_TITLE_TRIGRAM:
+            # Typo-tolerant title matches, served by the pg_trgm title index
+            title_similar = TrigramSimilar(F('title'), query)
+            matches |= title_similar
+            relevant |= title_similar
+
+        # Base queryset with search filtering and ranking. Results only show a
+        # snippet, so fetch the start of the content instead of all of it,
+        # and join the creator whose name is shown with each result.
         queryset = Document.objects.annotate(
-            rank=SearchRank('search_vector', search_query)
-        ).filter(
-            search_vector=search_query
-        ).filter(
-            rank__gt=0  # Only include documents with positive relevance
+            rank=SearchRank(F('search_vector'), search_query),
+            content_head=Substr('content', 1, SEARCH_SNIPPET_LENGTH + 1),
+        ).filter(matches).filter(relevant).select_related('created_by').defer(
+            'content', 'search_vector'
         ).order_by('-rank', '-updated_at')
         
         # Apply permission filtering
@@ -397,24 +760,31 @@ class DocumentService:
         else:
             # Anonymous users - limit to some public scope or no results
             # For security, return no results for anonymous users
-            queryset = Document.objects.none()
+            queryset = None
         
         # Apply limit
         if limit and limit > 0:
             # Limit to reasonable maximum
             limit = min(limit, 100)
-            total_count = queryset.count()
-            queryset = queryset[:limit]
         else:
-            total_count = queryset.count()
-            queryset = queryset[:20]  # Default limit
+            limit = 20  # Default limit
+
+        # Read the total match count off the returned rows with COUNT(*) OVER ()
+        # rather than running the match and ranking again for a separate COUNT
+        if queryset is None:
+            documents = []
+        else:
+            documents = list(
+                queryset.annotate(total_count=Window(expression=Count("*")))[:limit]
+            )
+        total_count = documents[0].total_count if documents else 0
         
-        search_time = round((time.time() - start_time) * 1000, 2)  # Convert to milliseconds
+        search_time = round((time.perf_counter_ns() - start_time) / 1_000_000, 2)  # Convert to milliseconds
         
-        logger.info(f"Search query '{query}' returned {total_count} results in {search_time}ms")
+        logger.info("Search query '%s' returned %d results in %sms", query, total_count, search_time)
         
         return {
-            "documents": queryset,
+            "documents": documents,
             "query": query,
             "total_results": total_count,
             "search_time": search_time,
@@ -443,4 +813,12 @@ class DocumentService:
             user=user,
             limit=limit,
             user_only=True
-        )
\ No newline at end of file
+        )
+
+
+@receiver(post_delete, sender=User)
+def forget_deleted_anonymous_user(sender, instance, **kwargs):
+    """Stop handing out the cached anonymous user once it is deleted."""
+    cached = DocumentService._anonymous_user
+    if cached is not None and cached.pk == instance.pk:
+        DocumentService._anonymous_user = None
@@ -113,6 +113,161 @@ def test_document_version_no_increment_on_other_fields(user, simple_document_con
 
     assert document.version == original_version
 
+@pytest.mark.django_db
+def test_document_content_hash_matches_database_md5(user):
+    """Test that content_hash is kept in step with PostgreSQL's md5(content)."""
+    from django.db import connection
+
+    document = Document.objects.create(
+        title="Hash Test", content="Unicode content – café", created_by=user
+    )
+    document.content = "Edited content"
+    document.save()
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT content_hash, md5(content) FROM documents_document WHERE id = %s",
+            [document.pk],
+        )
+        stored_hash, db_md5 = cursor.fetchone()
+
+    assert document.content_hash == stored_hash == db_md5
+    assert document.version == 2
+
+@pytest.mark.django_db
+def test_document_save_probe_does_not_load_content(user):
+    """Test that change detection compares hashes instead of fetching content."""
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    document = Document.objects.create(
+        title="Probe Test", content="Some content", created_by=user
+    )
+
+    with CaptureQueriesContext(connection) as queries:
+        document.save()
+
+    selects = [q["sql"] for q in queries.captured_queries if q["sql"].startswith("SELECT")]
+    assert len(selects) == 1
+    assert '"content_hash"' in selects[0]
+    assert '"documents_document"."content"' not in selects[0]
+
+@pytest.mark.django_db
+def test_document_etag_tracks_content_and_version(user):
+    """Test that the ETag changes with content and version but is stable otherwise."""
+    document = Document.objects.create(
+        title="ETag Test", content="First draft", created_by=user
+    )
+    original_etag = document.etag
+
+    assert document.etag == Document.objects.get(pk=document.pk).etag
+
+    document.content = "Second draft"
+    document.save()
+
+    assert document.etag != original_etag
+
+@pytest.mark.django_db
+def test_document_etag_reflects_unsaved_content(user):
+    """Test that the ETag follows content changes that aren't saved yet."""
+    document = Document.objects.create(
+        title="ETag Unsaved", content="First draft", created_by=user
+    )
+    saved_etag = document.etag
+
+    document.content = "Second draft"
+    unsaved_etag = document.etag
+    document.save(update_fields=["content"])
+
+    assert unsaved_etag != saved_etag
+    assert unsaved_etag == Document.objects.get(pk=document.pk).etag
+
+@pytest.mark.django_db
+def test_document_etag_reuses_stored_hash(user, monkeypatch):
+    """Test that unchanged content isn't re-hashed for the ETag."""
+    document = Document.objects.create(
+        title="ETag Stored", content="Body", created_by=user
+    )
+    loaded = Document.objects.get(pk=document.pk)
+
+    def fail(content):
+        raise AssertionError("content re-hashed")
+
+    monkeypatch.setattr(Document, "compute_content_hash", staticmethod(fail))
+
+    assert document.etag == loaded.etag
+
+@pytest.mark.django_db
+def test_document_etag_without_stored_hash(user):
+    """Test that rows written without save() still get a content-based ETag."""
+    document = Document.objects.create(
+        title="ETag Fallback", content="Body", created_by=user
+    )
+    expected = document.etag
+    Document.objects.filter(pk=document.pk).update(content_hash="")
+
+    assert Document.objects.get(pk=document.pk).etag == expected
+
+@pytest.mark.django_db
+def test_document_create_skips_change_probe(user, django_assert_num_queries):
+    """Test that creating a document issues only the INSERT."""
+    with django_assert_num_queries(1):
+        Document.objects.create(title="New Doc", content="Body", created_by=user)
+
+@pytest.mark.django_db
+def test_document_save_other_fields_skips_change_probe(user, django_assert_num_queries):
+    """Test that saving only untracked fields does not probe for changes."""
+    document = Document.objects.create(
+        title="Probe Skip", content="Body", created_by=user
+    )
+    document.last_modified_by = user
+
+    with django_assert_num_queries(1):
+        document.save(update_fields=["last_modified_by"])
+
+    assert document.version == 1
+
+@pytest.mark.django_db
+def test_document_title_save_skips_content_hash(user, monkeypatch, django_assert_num_queries):
+    """Test that saving a title neither loads nor re-hashes deferred content."""
+    document = Document.objects.create(
+        title="Title Only", content="Body", created_by=user
+    )
+    loaded = Document.objects.defer("content").get(pk=document.pk)
+
+    def fail(content):
+        raise AssertionError("content re-hashed")
+
+    monkeypatch.setattr(Document, "compute_content_hash", staticmethod(fail))
+
+    loaded.title = "Renamed"
+    with django_assert_num_queries(2):
+        loaded.save(update_fields=["title"])
+    loaded.title = "Renamed Again"
+    with django_assert_num_queries(2):
+        loaded.save()
+
+    assert loaded.version == 3
+    assert "content" in loaded.get_deferred_fields()
+
+@pytest.mark.django_db
+def test_document_save_without_stored_hash_keeps_version(user):
+    """Test that a row without a stored hash isn't treated as changed on save."""
+    document = Document.objects.create(
+        title="No Hash", content="Body", created_by=user
+    )
+    expected_hash = document.content_hash
+    Document.objects.filter(pk=document.pk).update(content_hash="")
+
+    loaded = Document.objects.get(pk=document.pk)
+    loaded.save()
+    assert loaded.version == 1
+    assert Document.objects.get(pk=document.pk).content_hash == expected_hash
+
+    loaded.content = "New body"
+    loaded.save()
+    assert loaded.version == 2
+
 @pytest.mark.django_db
 def test_document_ordering(user, simple_document_content):
     """Test document ordering by updated_at descending."""
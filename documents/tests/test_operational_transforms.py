@@ -64,7 +64,34 @@ class TestOTOperation:
         assert op.op_type == OperationType.DELETE
         assert op.position == 10
         assert op.length == 3
-    
+
+    def test_operation_uses_slots(self):
+        """Test operations and operation sets don't carry an instance __dict__."""
+        op = OTOperation(OperationType.INSERT, content="hi")
+        assert not hasattr(op, "__dict__")
+        assert op.attributes == {}
+        assert not hasattr(OTOperationSet([op]), "__dict__")
+
+    def test_operation_caches_content_length(self):
+        """Test that content_len is derived from content and ignored by equality."""
+        op = OTOperation(OperationType.INSERT, content="héllo")
+        assert op.content_len == 5
+        assert op.with_position(3).content_len == 5
+        assert OTOperation(OperationType.DELETE, length=4).content_len == 0
+        assert op == OTOperation(OperationType.INSERT, content="héllo")
+
+    def test_operation_with_position(self):
+        """Test copying an operation to a new position."""
+        op = OTOperation(OperationType.DELETE, position=4, length=3, attributes={"bold": True})
+
+        moved = op.with_position(1)
+        resized = op.with_position(2, 5)
+
+        assert (moved.position, moved.length) == (1, 3)
+        assert (resized.position, resized.length) == (2, 5)
+        assert moved.attributes is op.attributes
+        assert op.position == 4
+
     def test_operation_string_representation(self):
         """Test string representation of operations."""
         insert_op = OTOperation(OperationType.INSERT, position=0, content="test")
@@ -145,7 +172,17 @@ class TestOTOperationSet:
         
         result = ops.apply("Hello")
         assert result == "Hello"
-    
+
+    def test_apply_no_change_returns_text(self):
+        """Test that empty and full-retain sets return the input unchanged."""
+        text = "Hello world"
+
+        assert OTOperationSet().apply(text) is text
+        assert OTOperationSet().retain(len(text)).apply(text) is text
+        assert OTOperationSet().retain(5).apply(text) == text
+        with pytest.raises(ValueError):
+            OTOperationSet().retain(len(text) + 1).apply(text)
+
     def test_apply_delete_only(self):
         """Test applying delete-only operations."""
         ops = OTOperationSet()
@@ -204,6 +241,16 @@ class TestOTOperationSet:
         with pytest.raises(ValueError, match="extends beyond text length"):
             ops.apply("Hi")
     
+    def test_apply_operations_from_generator(self):
+        """Test applying operations streamed from a generator."""
+        def operations():
+            yield OTOperation(OperationType.RETAIN, length=5)
+            yield OTOperation(OperationType.DELETE, length=6)
+            yield OTOperation(OperationType.INSERT, content=" Universe")
+        
+        result = OTOperationSet.apply_operations("Hello World", operations())
+        assert result == "Hello Universe"
+    
     def test_operation_set_to_dict(self):
         """Test converting operation set to dictionary."""
         ops = OTOperationSet()
@@ -225,7 +272,7 @@ class TestOTOperationSet:
         assert len(ops) == 2
         assert ops.operations[0].op_type == OperationType.INSERT
         assert ops.operations[1].op_type == OperationType.RETAIN
-    
+
     def test_operation_set_string_representation(self):
         """Test string representation of operation set."""
         ops = OTOperationSet()
@@ -355,6 +402,50 @@ class TestOTDiffGenerator:
         retain_ops = [op for op in ops.operations if op.op_type == OperationType.RETAIN]
         assert len(retain_ops) >= 1  # At least the prefix should be retained
     
+    def test_common_prefix_suffix_across_scan_blocks(self):
+        """Test prefix/suffix detection on texts longer than a scan block."""
+        from documents.operational_transforms import _common_prefix_len, _common_suffix_len
+        
+        head = "a" * 1000 + "é"
+        tail = "ü" + "z" * 700
+        old_text = head + "OLD" + tail
+        new_text = head + "NEWER" + tail
+        
+        assert _common_prefix_len(old_text, new_text) == len(head)
+        assert _common_suffix_len(old_text, new_text, len(old_text) - len(head)) == len(tail)
+        assert _common_prefix_len("abc", "abc") == 3
+        assert _common_suffix_len("aaaa", "aa", 2) == 2
+        
+        ops = OTDiffGenerator.generate_operations(old_text, new_text)
+        assert ops.apply(old_text) == new_text
+        assert [op.op_type for op in ops.operations] == [
+            OperationType.RETAIN, OperationType.DELETE,
+            OperationType.INSERT, OperationType.RETAIN,
+        ]
+    
+    def test_generate_operations_with_hints(self):
+        """Test that prefix/suffix hints don't change the generated operations."""
+        old_text = "x" * 500 + "typing" + "y" * 300
+        new_text = "x" * 500 + "typing!" + "y" * 300
+        expected = OTDiffGenerator.generate_operations(old_text, new_text).to_dict()
+
+        for prefix_hint, suffix_hint in [(400, 200), (506, 300), (600, 0), (0, 900), (-5, -5)]:
+            ops = OTDiffGenerator.generate_operations(
+                old_text, new_text, prefix_hint=prefix_hint, suffix_hint=suffix_hint
+            )
+            assert ops.to_dict() == expected
+            assert ops.apply(old_text) == new_text
+
+    def test_generate_operations_does_not_apply(self, monkeypatch):
+        """Test that generating a diff doesn't re-apply it as a self-check."""
+        def fail_apply(self, text):
+            raise AssertionError("generate_operations should not call apply()")
+        
+        monkeypatch.setattr(OTOperationSet, "apply", fail_apply)
+        
+        ops = OTDiffGenerator.generate_operations("Hello world", "Hello there world")
+        assert len(ops) > 0
+    
     def test_generate_incremental_operations_fallback(self):
         """Test that incremental operations falls back to basic generation."""
         old_text = "Hello"
@@ -364,6 +455,23 @@ class TestOTDiffGenerator:
         result = ops.apply(old_text)
         assert result == new_text
 
+    def test_generate_incremental_operations_with_cursor(self):
+        """Test that a cursor hint produces the same operations as a full diff."""
+        old_text = "a" * 2000 + "b" * 2000
+        cases = [
+            (old_text[:2000] + "X" + old_text[2000:], 2001),  # typed a character
+            (old_text[:1999] + old_text[2000:], 1999),  # backspace
+            (old_text[:1000] + "Y" * 600 + old_text[1000:], 1600),  # long paste
+            (old_text + "!", 0),  # misleading cursor
+            ("", 50),  # cursor beyond the text
+        ]
+
+        for new_text, cursor in cases:
+            ops = OTDiffGenerator.generate_incremental_operations(old_text, new_text, cursor)
+            expected = OTDiffGenerator.generate_operations(old_text, new_text)
+            assert ops.to_dict() == expected.to_dict()
+            assert ops.apply(old_text) == new_text
+
 
 @pytest.mark.django_db
 class TestOTTransformer:
@@ -484,7 +592,24 @@ class TestOTTransformer:
         # Both operations should be adjusted to handle the intersection
         assert op1_prime.length < op1.length  # Should be reduced
         assert op2_prime.length < op2.length  # Should be reduced
-    
+
+    def test_transform_delete_delete_nested(self):
+        """Test transforming a delete against one nested inside it."""
+        text = "0123456789"
+        op1 = OTOperation(OperationType.DELETE, position=2, length=6)  # deletes 2-8
+        op2 = OTOperation(OperationType.DELETE, position=4, length=2)  # deletes 4-6
+
+        op1_prime, op2_prime = OTTransformer.transform_operations(op1, op2)
+
+        assert (op1_prime.position, op1_prime.length) == (2, 4)
+        assert op2_prime.length == 0
+
+        def apply_delete(value, op):
+            return value[:op.position] + value[op.position + op.length:]
+
+        assert apply_delete(apply_delete(text, op1), op2_prime) == "0189"
+        assert apply_delete(apply_delete(text, op2), op1_prime) == "0189"
+
     def test_transform_operation_sets(self):
         """Test transforming operation sets."""
         ops1 = OTOperationSet()
@@ -498,6 +623,39 @@ class TestOTTransformer:
         assert len(ops1_prime) == 2
         assert len(ops2_prime) == 2
     
+    def test_transform_operation_sets_accumulates_ops1_shifts(self):
+        """Test that ops2 is transformed against every op in ops1, not just the last."""
+        ops1 = OTOperationSet()
+        ops1.insert(0, "A").insert(3, "BB")
+        
+        ops2 = OTOperationSet()
+        ops2.insert(10, "Y")
+        
+        ops1_prime, ops2_prime = OTTransformer.transform_operation_sets(ops1, ops2)
+        
+        assert [op.position for op in ops1_prime] == [0, 3]
+        assert ops2_prime.operations[0].position == 13  # 10 + len("A") + len("BB")
+        assert ops2.operations[0].position == 10  # input set is not mutated
+
+    def test_transform_operation_sets_matches_pairwise_transforms(self):
+        """Test that transforming sets matches transforming op by op."""
+        ops1 = OTOperationSet()
+        ops1.insert(20, "AB").delete(30, 4).insert(2, "C")
+        ops2 = OTOperationSet()
+        ops2.insert(1, "X").delete(5, 3).insert(20, "YY").delete(28, 5).retain(4)
+
+        for priority in ("left", "right"):
+            expected_ops1 = []
+            expected_ops2 = list(ops2.operations)
+            for op1 in ops1.operations:
+                for i, op2 in enumerate(expected_ops2):
+                    op1, expected_ops2[i] = OTTransformer.transform_operations(op1, op2, priority)
+                expected_ops1.append(op1)
+
+            ops1_prime, ops2_prime = OTTransformer.transform_operation_sets(ops1, ops2, priority)
+            assert ops1_prime.operations == expected_ops1
+            assert ops2_prime.operations == expected_ops2
+
     def test_transform_with_retain_operations(self):
         """Test that retain operations don't conflict."""
         op1 = OTOperation(OperationType.RETAIN, length=5)
@@ -15,11 +15,14 @@ from django.test import TestCase, Client
 from django.contrib.auth.models import User
 from django.urls import reverse
 from django.core.management import call_command
+from django.db import connection
+from django.test import override_settings
 from django.contrib.postgres.search import SearchVector
 from rest_framework.test import APITestCase, APIClient
 from rest_framework.authtoken.models import Token
 from documents.models import Document, DocumentChange
 from documents.services import DocumentService
+from documents.checks import check_title_trigram_extension, pg_trgm_installed
 from documents.serializers import DocumentSearchResultSerializer
 from documents.api_client import DocumentAPIClient, APIClientError
 import json
@@ -52,6 +55,7 @@ class DocumentSearchVectorTestCase(TestCase):
         )
         
         # Search vector should be automatically created on save
+        doc.refresh_from_db(fields=['search_vector'])
         self.assertIsNotNone(doc.search_vector)
         
     def test_document_update_search_vector_method(self):
@@ -74,10 +78,27 @@ class DocumentSearchVectorTestCase(TestCase):
         )
         
         # Update search vector
-        doc.update_search_vector()
+        doc.update_search_vector(refresh=True)
         
         self.assertIsNotNone(doc.search_vector)
     
+    def test_update_search_vector_skips_refresh_by_default(self):
+        """Test update_search_vector() does not reload the vector unless asked."""
+        doc = Document.objects.create(
+            title='No Refresh',
+            content='Vector stays in the database',
+            created_by=self.user
+        )
+        doc.search_vector = None
+        
+        with self.assertNumQueries(1):
+            doc.update_search_vector()
+        
+        self.assertIsNone(doc.search_vector)
+        self.assertTrue(
+            Document.objects.filter(pk=doc.pk, search_vector__isnull=False).exists()
+        )
+    
     def test_document_save_updates_search_vector(self):
         """Test that saving a document updates search vector automatically."""
         doc = DocumentService.create_document(
@@ -93,6 +114,40 @@ class DocumentSearchVectorTestCase(TestCase):
         doc.refresh_from_db()
         self.assertIsNotNone(doc.search_vector)
     
+    def test_search_vector_trigger_tracks_content_changes(self):
+        """Test the database trigger rebuilds the vector when content is saved."""
+        doc = Document.objects.create(
+            title='Trigger Doc',
+            content='original wording',
+            created_by=self.user
+        )
+        
+        doc.content = 'replacement phrasing'
+        doc.save()
+        
+        self.assertTrue(
+            Document.objects.filter(pk=doc.pk, search_vector='replacement').exists()
+        )
+        self.assertFalse(
+            Document.objects.filter(pk=doc.pk, search_vector='original').exists()
+        )
+    
+    def test_search_vector_kept_when_title_and_content_unchanged(self):
+        """Test a full save with a stale in-memory vector keeps the stored one."""
+        doc = Document.objects.create(
+            title='Stable Doc',
+            content='steady wording',
+            created_by=self.user
+        )
+        self.assertIsNone(doc.search_vector)  # never loaded into memory
+        
+        doc.last_modified_by = self.user
+        doc.save()
+        
+        self.assertTrue(
+            Document.objects.filter(pk=doc.pk, search_vector='steady').exists()
+        )
+    
     def test_document_plain_text_extraction(self):
         """Test Document.get_plain_text property with plain text content."""
         # Test with plain text content
@@ -193,6 +248,60 @@ class DocumentServiceSearchTestCase(TestCase):
         # But user1 should only see doc1 when user_only=True by default in permission filtering
         self.assertGreater(results['total_results'], 0)
     
+    def test_search_documents_total_beyond_limit_single_query(self):
+        """Test that the total count comes back with the rows in one query."""
+        with self.assertNumQueries(1):
+            results = DocumentService.search_documents(
+                query='Python',
+                user=self.user1,
+                limit=1
+            )
+        
+        self.assertEqual(results['total_results'], 2)
+        self.assertEqual(len(results['documents']), 1)
+    
+    def test_search_documents_ranks_stored_vector(self):
+        """Test that ranking reads the stored vector instead of re-tokenizing it."""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        with CaptureQueriesContext(connection) as ctx:
+            results = DocumentService.search_documents(
+                query='Django',
+                user=self.user1,
+                limit=10
+            )
+        
+        self.assertEqual(results['total_results'], 1)
+        self.assertNotIn('to_tsvector', ctx.captured_queries[0]['sql'])
+    
+    def test_search_documents_results_serialize_without_queries(self):
+        """Test that results carry the snippet and creator without more queries."""
+        long_doc = DocumentService.create_document(
+            title='Python Style Notes',
+            content_text='Python ' + 'readable code matters ' * 50,
+            user=self.user1
+        )
+        self._ensure_search_vectors()
+        
+        results = DocumentService.search_documents(
+            query='Python',
+            user=self.user1,
+            limit=10
+        )
+        with self.assertNumQueries(0):
+            data = DocumentSearchResultSerializer(results['documents'], many=True).data
+        
+        expected = {
+            str(doc.id): DocumentSearchResultSerializer(doc).data
+            for doc in Document.objects.filter(id__in=[self.doc1.id, self.doc3.id, long_doc.id])
+        }
+        for item in data:
+            full = expected[item['id']]
+            self.assertEqual(item['content_snippet'], full['content_snippet'])
+            self.assertEqual(item['created_by_name'], full['created_by_name'])
+        self.assertIn(str(long_doc.id), [item['id'] for item in data])
+    
     def test_search_documents_empty_query(self):
         """Test search with empty query."""
         results = DocumentService.search_documents(
@@ -204,6 +313,7 @@ class DocumentServiceSearchTestCase(TestCase):
         self.assertEqual(results['total_results'], 0)
         self.assertEqual(results['query'], '')
         self.assertEqual(results['search_time'], 0)
+        self.assertEqual(results['documents'], [])
     
     def test_search_documents_no_results(self):
         """Test search with query that has no matches."""
@@ -214,6 +324,7 @@ class DocumentServiceSearchTestCase(TestCase):
         )
         
         self.assertEqual(results['total_results'], 0)
+        self.assertEqual(results['documents'], [])
         self.assertGreater(results['search_time'], 0)
     
     def test_search_documents_user_filtering(self):
@@ -270,14 +381,60 @@ class DocumentServiceSearchTestCase(TestCase):
     
     def test_search_anonymous_user(self):
         """Test search behavior with anonymous user."""
-        results = DocumentService.search_documents(
-            query='Django',
-            user=None,
-            limit=10
-        )
+        with self.assertNumQueries(0):
+            results = DocumentService.search_documents(
+                query='Django',
+                user=None,
+                limit=10
+            )
         
         # Anonymous users should get no results for security
         self.assertEqual(results['total_results'], 0)
+        self.assertEqual(results['documents'], [])
+
+
+class SearchTitleTrigramTestCase(TestCase):
+    """Test trigram title matching behind SEARCH_TITLE_TRIGRAM."""
+    
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='trigramuser',
+            email='trigram@example.com',
+            password='testpass123'
+        )
+        self.has_pg_trgm = pg_trgm_installed(connection)
+    
+    def test_check_requires_pg_trgm_when_enabled(self):
+        """Test that the system check reports a missing pg_trgm extension."""
+        with override_settings(SEARCH_TITLE_TRIGRAM=True):
+            errors = check_title_trigram_extension(databases=['default'])
+        
+        self.assertEqual([e.id for e in errors], [] if self.has_pg_trgm else ['documents.E001'])
+    
+    def test_check_skipped_when_disabled(self):
+        """Test that the system check doesn't query anything with the flag off."""
+        with override_settings(SEARCH_TITLE_TRIGRAM=False):
+            with self.assertNumQueries(0):
+                self.assertEqual(check_title_trigram_extension(databases=['default']), [])
+    
+    def test_search_matches_misspelled_title(self):
+        """Test that a misspelled title is found by trigram similarity."""
+        if not self.has_pg_trgm:
+            self.skipTest('pg_trgm extension is not installed')
+        
+        doc = DocumentService.create_document(
+            title='Kubernetes Deployment Guide',
+            content_text='Rolling updates and health checks',
+            user=self.user
+        )
+        
+        with override_settings(SEARCH_TITLE_TRIGRAM=False):
+            results = DocumentService.search_documents(query='Kubernets Deploymnt Guide', user=self.user)
+        self.assertEqual(results['total_results'], 0)
+        
+        with override_settings(SEARCH_TITLE_TRIGRAM=True):
+            results = DocumentService.search_documents(query='Kubernets Deploymnt Guide', user=self.user)
+        self.assertEqual([d.id for d in results['documents']], [doc.id])
 
 
 class DocumentSearchAPITestCase(APITestCase):
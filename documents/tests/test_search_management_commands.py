@@ -7,11 +7,15 @@ This test module covers:
 """
 
 import pytest
-from django.test import TestCase
+from django.test import TestCase, TransactionTestCase
 from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.contrib.auth.models import User
 from django.contrib.postgres.search import SearchVector
 from io import StringIO
+from unittest import mock
+from documents.management.commands import process_search_queue
 from documents.models import Document
 from documents.services import DocumentService
 
@@ -176,6 +180,69 @@ class UpdateSearchVectorsCommandTestCase(TestCase):
         self.assertIn('Found 7 documents to process', output)  # 2 original + 5 new
         self.assertIn('Processing documents in batches of 3', output)
     
+    def test_update_search_vectors_one_update_per_batch(self):
+        """Test each batch is written with a single UPDATE statement."""
+        for i in range(5):
+            Document.objects.create(
+                title=f'Bulk Doc {i}',
+                content='Bulk content',
+                created_by=self.user
+            )
+
+        with CaptureQueriesContext(connection) as queries:
+            call_command(
+                'update_search_vectors', '--batch-size=3', '--force', stdout=StringIO()
+            )
+
+        updates = [q for q in queries.captured_queries if q['sql'].startswith('UPDATE')]
+        self.assertEqual(len(updates), 3)  # 7 documents in batches of 3
+
+    def test_update_search_vectors_throttles_progress(self):
+        """Test progress lines are throttled but the final count is always shown."""
+        for i in range(5):
+            Document.objects.create(
+                title=f'Progress Doc {i}',
+                content='Progress content',
+                created_by=self.user
+            )
+
+        out = StringIO()
+        call_command('update_search_vectors', '--batch-size=1', '--force', stdout=out)
+
+        output = out.getvalue()
+        self.assertIn('Processed 7/7 documents', output)
+        self.assertLess(output.count('Processed '), 7)
+
+    def test_update_search_vectors_server_side(self):
+        """Test --server-side rebuilds every document with one UPDATE."""
+        out = StringIO()
+        with CaptureQueriesContext(connection) as queries:
+            call_command('update_search_vectors', '--server-side', stdout=out)
+
+        output = out.getvalue()
+        self.assertIn('single UPDATE', output)
+        self.assertIn('Successfully processed: 2', output)
+
+        updates = [q for q in queries.captured_queries if q['sql'].startswith('UPDATE')]
+        self.assertEqual(len(updates), 1)
+
+        self.doc1.refresh_from_db()
+        self.doc2.refresh_from_db()
+        self.assertIsNotNone(self.doc1.search_vector)
+        self.assertIsNotNone(self.doc2.search_vector)
+
+    def test_update_search_vectors_workers(self):
+        """Test --workers parameter falls back to in-process for a single worker."""
+        out = StringIO()
+        call_command('update_search_vectors', '--workers=1', stdout=out)
+        
+        output = out.getvalue()
+        self.assertIn('Successfully processed: 2', output)
+        self.assertNotIn('worker processes', output)
+        
+        self.doc1.refresh_from_db()
+        self.assertIsNotNone(self.doc1.search_vector)
+    
     def test_update_search_vectors_error_handling(self):
         """Test command error handling with malformed content."""
         # Create document with potentially problematic content
@@ -194,6 +261,145 @@ class UpdateSearchVectorsCommandTestCase(TestCase):
         self.assertIn('Search vector update completed', output)
 
 
+class UpdateSearchVectorsWorkersTestCase(TransactionTestCase):
+    """Test the update_search_vectors command with a worker pool.
+
+    Workers use their own database connections, so the data has to be
+    committed rather than held in a test transaction.
+    """
+    
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='workeruser',
+            email='worker@example.com',
+            password='testpass123'
+        )
+        for i in range(5):
+            Document.objects.create(
+                title=f'Worker Doc {i}',
+                content='Worker content',
+                created_by=self.user
+            )
+        Document.objects.update(search_vector=None)
+    
+    def test_update_search_vectors_with_worker_pool(self):
+        """Test --workers distributes batches across processes."""
+        out = StringIO()
+        call_command(
+            'update_search_vectors', '--workers=2', '--batch-size=2', stdout=out
+        )
+        
+        output = out.getvalue()
+        self.assertIn('Using 2 worker processes', output)
+        self.assertIn('Successfully processed: 5', output)
+        self.assertFalse(
+            Document.objects.filter(search_vector__isnull=True).exists()
+        )
+
+
+class ProcessSearchQueueCommandTestCase(TestCase):
+    """Test deferred search indexing and the process_search_queue command."""
+    
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='queueuser',
+            email='queue@example.com',
+            password='testpass123'
+        )
+        # Enable deferred indexing for this test's transaction only
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL documents.defer_search_vector = 'on'")
+    
+    def _queued_ids(self):
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT document_id FROM documents_searchqueue')
+            return {row[0] for row in cursor.fetchall()}
+    
+    def test_deferred_write_queues_document(self):
+        """Test writes are queued instead of indexed when deferral is on."""
+        doc = Document.objects.create(
+            title='Queued Document',
+            content='Deferred content',
+            created_by=self.user
+        )
+        doc.content = 'Deferred content edited'
+        doc.save()
+        
+        doc.refresh_from_db()
+        self.assertIsNone(doc.search_vector)
+        self.assertEqual(self._queued_ids(), {doc.pk})
+    
+    def test_unchanged_save_is_not_queued(self):
+        """Test saves that leave title and content alone are not re-queued."""
+        doc = Document.objects.create(
+            title='Queued Once', content='Deferred content', created_by=self.user
+        )
+        call_command('process_search_queue', stdout=StringIO())
+        
+        doc.last_modified_by = self.user
+        doc.save()
+        
+        self.assertEqual(self._queued_ids(), set())
+    
+    def test_process_search_queue_drains_queue(self):
+        """Test the command indexes queued documents and empties the queue."""
+        docs = [
+            Document.objects.create(
+                title=f'Queued {i}', content='Deferred content', created_by=self.user
+            )
+            for i in range(3)
+        ]
+        
+        out = StringIO()
+        call_command('process_search_queue', '--batch-size=2', stdout=out)
+        
+        self.assertIn('Processed 3 queued documents', out.getvalue())
+        self.assertEqual(self._queued_ids(), set())
+        self.assertEqual(
+            Document.objects.filter(
+                pk__in=[d.pk for d in docs], search_vector='deferred'
+            ).count(),
+            3
+        )
+
+
+class StopListening(Exception):
+    """Raised by test doubles to leave the --listen loop."""
+
+
+class ProcessSearchQueueListenTestCase(TransactionTestCase):
+    """Test process_search_queue --listen.
+
+    The command closes and reopens the connection, which can't happen inside
+    a test transaction.
+    """
+
+    def test_listen_reconnects_after_connection_loss(self):
+        """Test a dropped connection is reopened instead of stopping the worker."""
+        drains = []
+        real_drain_queue = process_search_queue.Command.drain_queue
+
+        def drain_queue(command, batch_size):
+            drains.append(batch_size)
+            if len(drains) == 1:
+                # Drop the server connection under the worker
+                connection.connection.close()
+                return real_drain_queue(command, batch_size)
+            raise StopListening
+
+        err = StringIO()
+        with mock.patch.object(process_search_queue.Command, 'drain_queue', drain_queue), \
+                mock.patch.object(process_search_queue.time, 'sleep') as sleep:
+            with self.assertRaises(StopListening):
+                call_command('process_search_queue', '--listen', stdout=StringIO(), stderr=err)
+
+        self.assertEqual(len(drains), 2)
+        sleep.assert_called_once_with(process_search_queue.RECONNECT_DELAY)
+        self.assertIn('reconnecting', err.getvalue())
+        # The new connection is usable
+        self.assertEqual(Document.objects.count(), 0)
+
+
 class SearchStatsCommandTestCase(TestCase):
     """Test the search_stats management command."""
     
@@ -9,6 +9,7 @@ from documents.serializers import (
     DocumentSerializer,
     DocumentCreateSerializer,
     ChangeOperationSerializer,
+    DocumentChangeSerializer,
 )
 
 
@@ -39,6 +40,30 @@ def test_user_serializer_data(user):
     assert data["id"] == user.id
 
 
+@pytest.mark.django_db
+def test_user_serializer_matches_field_representation(user):
+    """Test the handwritten representation matches DRF's per-field output."""
+    from rest_framework import serializers
+
+    serializer = UserSerializer(user)
+    expected = serializers.ModelSerializer.to_representation(serializer, user)
+
+    assert serializer.data == expected
+    assert list(serializer.data) == UserSerializer.Meta.fields
+
+
+def test_cached_fields_are_not_shared_between_instances():
+    """Test that per-instance field changes don't leak to other serializers."""
+    first = DocumentSerializer()
+    first.fields["title"].validators.append(lambda value: None)
+    first.fields["title"].error_messages["blank"] = "Changed"
+
+    second = DocumentSerializer()
+
+    assert len(second.fields["title"].validators) == len(first.fields["title"].validators) - 1
+    assert second.fields["title"].error_messages["blank"] != "Changed"
+
+
 @pytest.mark.django_db
 def test_document_list_serializer_fields(document):
     """Test DocumentListSerializer includes correct fields."""
@@ -72,6 +97,33 @@ def test_document_list_serializer_nested_user(document):
     assert data["created_by"]["username"] == "testuser"
 
 
+@pytest.mark.django_db
+def test_document_list_serializer_values_fields():
+    """Test that the list projection follows the serializers' Meta.fields."""
+    assert DocumentListSerializer.values_fields == [
+        "id",
+        "title",
+        "version",
+        "created_at",
+        "updated_at",
+        *[f"created_by__{name}" for name in UserSerializer.Meta.fields],
+    ]
+
+
+@pytest.mark.django_db
+def test_document_list_serializer_represent_values(user, document):
+    """Test that projected rows match the instance representation."""
+    second = Document.objects.create(title="Second", content="", created_by=user)
+    serializer = DocumentListSerializer()
+
+    rows = Document.objects.filter(pk__in=[document.pk, second.pk]).order_by("title")
+    data = serializer.represent_values(rows.values(*serializer.values_fields))
+
+    assert data == DocumentListSerializer(rows, many=True).data
+    # Rows by the same creator share one nested representation
+    assert data[0]["created_by"] is data[1]["created_by"]
+
+
 @pytest.mark.django_db
 def test_document_list_serializer_read_only_fields():
     """Test DocumentListSerializer read-only fields."""
@@ -102,6 +154,51 @@ def test_document_serializer_fields(document):
         assert field in data
 
 
+@pytest.mark.django_db
+def test_document_serializer_fields_are_per_instance(document, user):
+    """Test that cached field prototypes are copied and bound per serializer."""
+    first = DocumentSerializer(document)
+    second = DocumentSerializer(document)
+
+    for name in ("title", "created_by", "created_by_name"):
+        assert first.fields[name] is not second.fields[name]
+        assert first.fields[name].parent is first
+        assert second.fields[name].parent is second
+
+    assert first.data == second.data
+    assert second.data["created_by_name"] == user.get_full_name()
+
+    invalid = DocumentSerializer(document, data={"title": ""}, partial=True)
+    assert not invalid.is_valid()
+    valid = DocumentSerializer(document, data={"title": "Renamed"}, partial=True)
+    assert valid.is_valid(), valid.errors
+
+
+@pytest.mark.django_db
+def test_document_serializer_user_names_from_annotation(user):
+    """Test that annotated and Python-computed user names agree."""
+    nameless = User.objects.create_user(username="nameless", password="pass")
+    named = Document.objects.create(title="Named", content="", created_by=user)
+    unnamed = Document.objects.create(title="Unnamed", content="", created_by=nameless)
+    Document.objects.filter(pk=unnamed.pk).update(last_modified_by=None)
+    unnamed.refresh_from_db()
+
+    queryset = DocumentSerializer.annotate_user_names(
+        Document.objects.filter(pk__in=[named.pk, unnamed.pk])
+    )
+    annotated = {doc.pk: doc for doc in queryset}
+    assert annotated[named.pk].created_by_full_name == "Test User"
+
+    for document in (named, unnamed):
+        expected = DocumentSerializer(document).data
+        data = DocumentSerializer(annotated[document.pk]).data
+        assert data["created_by_name"] == expected["created_by_name"]
+        assert data["last_modified_by_name"] == expected["last_modified_by_name"]
+
+    assert DocumentSerializer(unnamed).data["created_by_name"] == "nameless"
+    assert DocumentSerializer(unnamed).data["last_modified_by_name"] is None
+
+
 @pytest.mark.django_db
 def test_document_serializer_content_included(document):
     """Test DocumentSerializer includes content field."""
@@ -290,6 +387,26 @@ def test_document_create_serializer_full_flow(user):
     assert document.version == 1
 
 
+@pytest.mark.parametrize("changes", [
+    [{"operation": "retain", "length": 5}, {"operation": "insert", "content": "  hi  "}],
+    [{"operation": "delete", "length": "3", "extra": True}, {"operation": " retain ", "length": 2.0}],
+    [{"operation": "insert", "content": ""}, {"operation": "retain", "length": 0}],
+    [{"operation": "move", "length": 1}, "not a dict", {"operation": "delete"}],
+    [{"operation": "insert", "content": "a\x00b"}, {"operation": "retain", "length": True}],
+    {"operation": "retain", "length": 1},
+])
+def test_document_change_serializer_matches_operation_serializer(changes):
+    """Test that batched change validation matches ChangeOperationSerializer(many=True)."""
+    def validate(field):
+        try:
+            return [dict(change) for change in field.run_validation(changes)], None
+        except ValidationError as exc:
+            return None, exc.detail
+
+    expected = validate(ChangeOperationSerializer(many=True))
+    assert validate(DocumentChangeSerializer().fields["changes"]) == expected
+
+
 @pytest.mark.django_db
 class TestChangeOperationSerializer:
     """Test cases for ChangeOperationSerializer whitespace preservation."""
@@ -1,6 +1,8 @@
 import pytest
+from collections import OrderedDict
 from django.contrib.auth.models import User
-from django.db import transaction
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
 from documents.models import Document, DocumentChange
 from documents.services import DocumentService
 from documents.exceptions import VersionConflictError, InvalidChangeError
@@ -75,6 +77,47 @@ class TestDocumentService:
         changes = document.changes.all()
         assert changes.count() == 1
 
+    def test_anonymous_user_is_resolved_once(
+        self, django_assert_num_queries, django_capture_on_commit_callbacks
+    ):
+        """Test that the anonymous user lookup is cached after the first create."""
+        with django_capture_on_commit_callbacks(execute=True):
+            DocumentService.create_document(title="First", user=None)
+
+        # Document INSERT and change record INSERT in a savepoint (the test
+        # runs in a transaction), no user lookup
+        with django_assert_num_queries(4):
+            document = DocumentService.create_document(title="Second", user=None)
+
+        assert document.created_by.username == "anonymous"
+        assert User.objects.filter(username="anonymous").count() == 1
+
+    def test_anonymous_user_not_cached_before_commit(self):
+        """Test that a rolled back anonymous user is never cached."""
+        with pytest.raises(RuntimeError):
+            with transaction.atomic():
+                DocumentService.create_document(title="Rolled Back", user=None)
+                raise RuntimeError("rollback")
+
+        assert DocumentService._anonymous_user is None
+        assert not User.objects.filter(username="anonymous").exists()
+
+        document = DocumentService.create_document(title="Kept", user=None)
+        assert User.objects.filter(pk=document.created_by_id).exists()
+
+    def test_anonymous_user_cache_cleared_on_delete(self, django_capture_on_commit_callbacks):
+        """Test that deleting the anonymous user clears the cache."""
+        with django_capture_on_commit_callbacks(execute=True):
+            anonymous = DocumentService.get_anonymous_user()
+        assert DocumentService._anonymous_user is not None
+
+        User.objects.filter(pk=anonymous.pk).delete()
+
+        assert DocumentService._anonymous_user is None
+        document = DocumentService.create_document(title="After Delete", user=None)
+        assert document.created_by.pk != anonymous.pk
+        assert User.objects.filter(pk=document.created_by_id).exists()
+
     def test_create_document_with_plain_text_content(self, user):
         """Test creating a document with plain text content."""
         title = "Plain Text Document"
@@ -104,6 +147,17 @@ class TestDocumentService:
         # This test is no longer applicable since we switched to plain text
         pass
 
+    def test_create_document_rolls_back_without_change_record(self, user, monkeypatch):
+        """Test that the document isn't kept if its change record can't be written."""
+        def fail(**kwargs):
+            raise RuntimeError("change record failed")
+
+        monkeypatch.setattr(DocumentChange.objects, "create", fail)
+        with pytest.raises(RuntimeError):
+            DocumentService.create_document(title="Orphan", user=user)
+
+        assert not Document.objects.filter(title="Orphan").exists()
+
     def test_update_document_title_and_content(self, user):
         """Test updating both title and content."""
         # Create initial document
@@ -162,6 +216,26 @@ class TestDocumentService:
         assert "title_change" in change.change_data
         assert "content_change" not in change.change_data
 
+    def test_update_document_title_only_skips_content_column(self, user):
+        """Test that a title change doesn't write the unchanged content back."""
+        document = DocumentService.create_document(
+            title="Original Title", content_text="Original content", user=user
+        )
+
+        with CaptureQueriesContext(connection) as ctx:
+            DocumentService.update_document(document=document, title="New Title", user=user)
+
+        updates = [q["sql"] for q in ctx.captured_queries if q["sql"].startswith("UPDATE")]
+        assert len(updates) == 1
+        assert '"title"' in updates[0]
+        assert '"content"' not in updates[0]
+        assert '"content_hash"' not in updates[0]
+
+        document.refresh_from_db()
+        assert document.title == "New Title"
+        assert document.content == "Original content"
+        assert document.version == 2
+
     def test_update_document_content_only(self, user):
         """Test updating only the content."""
         document = DocumentService.create_document(
@@ -210,6 +284,17 @@ class TestDocumentService:
         assert updated_document.version == original_version
         assert document.changes.count() == original_change_count
 
+    def test_update_document_no_changes_no_queries(self, user, django_assert_num_queries):
+        """Test that a no-op update doesn't touch the database."""
+        document = DocumentService.create_document(
+            title="Test Title", content_text="Test content", user=user
+        )
+
+        with django_assert_num_queries(0):
+            DocumentService.update_document(
+                document=document, title="Test Title ", content_text="Test content", user=user
+            )
+
     def test_update_document_version_conflict(self, user):
         """Test version conflict detection."""
         document = DocumentService.create_document(
@@ -225,6 +310,40 @@ class TestDocumentService:
                 expected_version=999  # Wrong version
             )
 
+    def test_update_document_expected_version_concurrent_modification(self, user):
+        """Test that update_document checks expected_version in the UPDATE."""
+        document = DocumentService.create_document(title="Test", content_text="Body", user=user)
+        Document.objects.filter(pk=document.pk).update(title="Other", version=2)
+
+        with pytest.raises(VersionConflictError):
+            DocumentService.update_document(
+                document=document, title="Mine", user=user, expected_version=1
+            )
+
+        document.refresh_from_db()
+        assert document.title == "Other"
+        assert document.changes.count() == 1
+
+    def test_update_document_expected_version_single_update(self, user):
+        """Test that a versioned update writes without re-reading the row."""
+        document = DocumentService.create_document(title="Test", content_text="Body", user=user)
+
+        with CaptureQueriesContext(connection) as ctx:
+            DocumentService.update_document(
+                document=document, content_text="New body", user=user, expected_version=1
+            )
+
+        statements = [q["sql"].split()[0] for q in ctx.captured_queries]
+        assert "SELECT" not in statements
+        assert statements.count("UPDATE") == 1
+        assert document.version == 2
+
+        document.refresh_from_db()
+        assert document.content == "New body"
+        assert document.version == 2
+        assert document.content_hash == Document.compute_content_hash("New body")
+        assert document.last_modified_by == user
+
     def test_update_document_validation_errors(self, user):
         """Test update validation."""
         document = DocumentService.create_document(title="Test", user=user)
@@ -274,6 +393,30 @@ class TestDocumentService:
         change_record = change_records.first()
         assert change_record.change_data == changes
 
+    def test_apply_changes_only_writes_edited_columns(self, user):
+        """Test that applying changes doesn't rewrite unrelated columns."""
+        document = DocumentService.create_document(
+            title="Test Document", content_text="Hello world", user=user
+        )
+
+        with CaptureQueriesContext(connection) as ctx:
+            DocumentService.apply_changes(
+                document=document,
+                changes=[{"operation": "retain", "length": 11}, {"operation": "insert", "content": "!"}],
+                user=user,
+                expected_version=document.version,
+            )
+
+        updates = [q["sql"] for q in ctx.captured_queries if q["sql"].startswith("UPDATE")]
+        assert len(updates) == 1
+        assert '"search_vector"' not in updates[0]
+        assert '"created_by_id"' not in updates[0]
+
+        document.refresh_from_db()
+        assert document.content == "Hello world!"
+        assert document.version == 2
+        assert document.content_hash == Document.compute_content_hash("Hello world!")
+
     def test_apply_changes_version_conflict(self, user):
         """Test version conflict in apply_changes."""
         document = DocumentService.create_document(title="Test", user=user)
@@ -288,6 +431,92 @@ class TestDocumentService:
                 expected_version=999
             )
 
+    def test_apply_changes_bulk_matches_sequential_apply(self, user):
+        """Test that bulk application equals applying each batch in turn."""
+        batches = [
+            [{"operation": "retain", "length": 5}, {"operation": "insert", "content": ","}],
+            [{"operation": "retain", "length": 12}],
+            [{"operation": "retain", "length": 6}, {"operation": "delete", "length": 6}, {"operation": "insert", "content": " there"}],
+        ]
+        sequential = DocumentService.create_document(title="Seq", content_text="Hello world", user=user)
+        for batch in batches:
+            DocumentService.apply_changes(sequential, batch, user, sequential.version)
+        bulk = DocumentService.create_document(title="Bulk", content_text="Hello world", user=user)
+
+        with CaptureQueriesContext(connection) as ctx:
+            DocumentService.apply_changes_bulk(bulk, batches, user, bulk.version)
+
+        assert len([q for q in ctx.captured_queries if q["sql"].startswith("INSERT")]) == 1
+        assert len([q for q in ctx.captured_queries if q["sql"].startswith("UPDATE")]) == 1
+
+        bulk.refresh_from_db()
+        assert bulk.content == sequential.content == "Hello, there"
+        assert bulk.version == sequential.version == 3
+        assert bulk.content_hash == Document.compute_content_hash("Hello, there")
+
+        def versions(document):
+            return sorted(document.changes.values_list("from_version", "to_version"))
+
+        assert versions(bulk) == versions(sequential)
+
+    def test_apply_changes_bulk_invalid_batch(self, user):
+        """Test that one invalid batch rejects the whole bulk application."""
+        document = DocumentService.create_document(title="Test", content_text="Hello", user=user)
+
+        with pytest.raises(InvalidChangeError):
+            DocumentService.apply_changes_bulk(
+                document,
+                [[{"operation": "retain", "length": 5}], [{"operation": "delete", "length": 50}]],
+                user,
+                document.version,
+            )
+        with pytest.raises(ValueError, match="At least one change is required"):
+            DocumentService.apply_changes_bulk(document, [[]], user, document.version)
+
+        document.refresh_from_db()
+        assert document.content == "Hello"
+        assert document.changes.count() == 1
+
+    def test_create_documents_bulk(self, user):
+        """Test bulk creation matches create_document for each document."""
+        documents = DocumentService.create_documents_bulk(
+            [{"title": " First ", "content": "One "}, {"title": "Second"}], user=user
+        )
+
+        assert [d.title for d in documents] == ["First", "Second"]
+        first = Document.objects.get(pk=documents[0].pk)
+        assert first.content == "One"
+        assert first.content_hash == Document.compute_content_hash("One")
+        assert first.version == 1
+        assert first.created_by == user
+        change = first.changes.get()
+        assert (change.from_version, change.to_version) == (0, 1)
+        assert change.change_data["operation"] == "create"
+
+        with pytest.raises(ValueError, match="Title cannot be empty"):
+            DocumentService.create_documents_bulk([{"title": " "}], user=user)
+
+    def test_apply_changes_concurrent_modification(self, user):
+        """Test that an edit committed after the document was read is a conflict."""
+        document = DocumentService.create_document(
+            title="Test", content_text="Hello", user=user
+        )
+        stale_version = document.version
+        Document.objects.filter(pk=document.pk).update(content="Hi", version=stale_version + 1)
+
+        with pytest.raises(VersionConflictError):
+            DocumentService.apply_changes(
+                document=document,
+                changes=[{"operation": "retain", "length": 5}, {"operation": "insert", "content": "!"}],
+                user=user,
+                expected_version=stale_version,
+            )
+
+        document.refresh_from_db()
+        assert document.content == "Hi"
+        assert document.version == stale_version + 1
+        assert not document.changes.filter(from_version=stale_version).exists()
+
     def test_apply_changes_validation_errors(self, user):
         """Test apply_changes validation."""
         document = DocumentService.create_document(title="Test", user=user)
@@ -321,6 +550,75 @@ class TestDocumentService:
         assert preview["current_version"] == document.version
         assert "preview" in preview
 
+    def test_apply_changes_reuses_preview_result(self, user, monkeypatch):
+        """Test that applying previewed changes doesn't redo the OT work."""
+        document = DocumentService.create_document(
+            title="Test Document", content_text="Hello world", user=user
+        )
+        changes = [
+            {"operation": "retain", "length": 6},
+            {"operation": "delete", "length": 5},
+            {"operation": "insert", "content": "universe"},
+        ]
+        preview = DocumentService.preview_changes(document, changes)
+
+        def fail(changes):
+            raise AssertionError("changes converted again")
+
+        monkeypatch.setattr(DocumentService, "_iter_ot_operations", staticmethod(fail))
+        updated = DocumentService.apply_changes(document, changes, user, document.version)
+
+        assert updated.content == preview["preview"]["preview_text"] == "Hello universe"
+        assert updated.version == 2
+
+        # The previewed result was for version 1, so it must not be reused now
+        monkeypatch.undo()
+        updated = DocumentService.apply_changes(document, changes, user, document.version)
+        assert updated.content == "Hello universerse"
+
+    def test_apply_changes_reuses_preview_of_raw_changes(self, user, monkeypatch):
+        """Test that a preview keyed from raw request data matches validated changes."""
+        document = DocumentService.create_document(
+            title="Test Document", content_text="Hello world", user=user
+        )
+        raw_changes = [
+            {"operation": "retain", "length": 6, "client_id": "a"},
+            {"operation": "delete", "length": 5, "content": ""},
+            {"operation": "insert", "content": "universe", "client_id": "b"},
+        ]
+        DocumentService.preview_changes(document, raw_changes)
+
+        def fail(changes):
+            raise AssertionError("changes converted again")
+
+        monkeypatch.setattr(DocumentService, "_iter_ot_operations", staticmethod(fail))
+        validated_changes = [
+            {"operation": "retain", "length": 6},
+            {"operation": "delete", "length": 5, "content": ""},
+            {"operation": "insert", "content": "universe"},
+        ]
+        updated = DocumentService.apply_changes(document, validated_changes, user, 1)
+
+        assert updated.content == "Hello universe"
+
+    def test_preview_results_limited_by_text_size(self, user, monkeypatch):
+        """Test that previewed texts are only kept up to the total size limit."""
+        monkeypatch.setattr(DocumentService, "PREVIEW_RESULTS_MAX_CHARS", 20)
+        monkeypatch.setattr(DocumentService, "_preview_results", OrderedDict())
+        document = DocumentService.create_document(
+            title="Test Document", content_text="Hello", user=user
+        )
+
+        for word in ("one", "two", "three"):
+            DocumentService.preview_changes(
+                document, [{"operation": "retain", "length": 5}, {"operation": "insert", "content": word}]
+            )
+        DocumentService.preview_changes(
+            document, [{"operation": "insert", "content": "x" * 30}]
+        )
+
+        assert list(DocumentService._preview_results.values()) == ["Hellotwo", "Hellothree"]
+
     def test_preview_changes_validation(self, user):
         """Test preview changes validation."""
         document = DocumentService.create_document(title="Test", user=user)
@@ -358,6 +656,34 @@ class TestDocumentService:
         limited_history = DocumentService.get_change_history(document, limit=2)
         assert len(list(limited_history)) == 2
 
+    def test_get_change_history_stream(self, user, django_assert_num_queries):
+        """Test streaming change history without change_data."""
+        document = DocumentService.create_document(title="Test Document", user=user)
+        DocumentService.update_document(document=document, title="Updated Title", user=user)
+
+        with CaptureQueriesContext(connection) as ctx:
+            history = list(DocumentService.get_change_history(document, stream=True))
+
+        assert [change.to_version for change in history] == [2, 1]
+        assert "change_data" not in ctx.captured_queries[0]["sql"]
+        # Deferred change_data is fetched per change
+        with django_assert_num_queries(1):
+            assert history[0].change_data["title_change"]["to"] == "Updated Title"
+
+    def test_get_change_history_stream_joins_applied_by(self, user, django_assert_num_queries):
+        """Test streaming change history loads applied_by in the same query."""
+        document = DocumentService.create_document(title="Test Document", user=user)
+        for i in range(3):
+            DocumentService.update_document(document=document, title=f"Title {i}", user=user)
+
+        with django_assert_num_queries(1):
+            usernames = [
+                change.applied_by.username
+                for change in DocumentService.get_change_history(document, stream=True)
+            ]
+
+        assert usernames == [user.username] * 4
+
     def test_atomic_operations(self, user):
         """Test that operations are atomic."""
         document = DocumentService.create_document(title="Test", user=user)
@@ -43,6 +43,98 @@ def test_document_list_authenticated_user(user, simple_document_content):
     assert "results" in response.data
 
 
+@pytest.mark.django_db
+def test_document_list_query_count_independent_of_rows(
+    user, simple_document_content, django_assert_num_queries
+):
+    """Test that listing documents doesn't query the creator per row."""
+    other = User.objects.create_user(username="other", password="pass")
+    for i in range(5):
+        Document.objects.create(
+            title=f"Doc {i}", content=simple_document_content,
+            created_by=user if i % 2 else other,
+        )
+
+    client = APIClient()
+    client.force_authenticate(user=user)
+
+    # One COUNT for pagination and one SELECT joined with the creator
+    with django_assert_num_queries(2):
+        response = client.get(reverse("document-list"))
+
+    assert response.status_code == status.HTTP_200_OK
+    usernames = {doc["created_by"]["username"] for doc in response.data["results"]}
+    assert usernames == {"testuser", "other"}
+
+
+@pytest.mark.django_db
+def test_document_retrieve_skips_search_vector(user, simple_document_content):
+    """Test that the detail query doesn't select the search vector column."""
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    document = Document.objects.create(
+        title="Detail", content=simple_document_content, created_by=user
+    )
+    client = APIClient()
+    client.force_authenticate(user=user)
+
+    with CaptureQueriesContext(connection) as ctx:
+        response = client.get(reverse("document-detail", args=[document.id]))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["content"] == simple_document_content
+    assert len(ctx.captured_queries) == 1
+    assert '"search_vector"' not in ctx.captured_queries[0]["sql"]
+
+
+@pytest.mark.django_db
+def test_document_history_query_count_independent_of_rows(
+    user, simple_document_content, django_assert_num_queries
+):
+    """Test that change history joins the applying user instead of querying per row."""
+    from documents.models import DocumentChange
+
+    other = User.objects.create_user(username="other", password="pass")
+    document = Document.objects.create(
+        title="History", content=simple_document_content, created_by=user
+    )
+    for version in range(1, 5):
+        DocumentChange.objects.create(
+            document=document,
+            change_data={"operation": "retain"},
+            applied_by=user if version % 2 else other,
+            from_version=version,
+            to_version=version + 1,
+        )
+
+    client = APIClient()
+    client.force_authenticate(user=user)
+
+    # Document lookup, COUNT for pagination, and one SELECT joined with users
+    with django_assert_num_queries(3):
+        response = client.get(reverse("document-change-history", args=[document.id]))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert {c["applied_by"]["username"] for c in response.data["results"]} == {"testuser", "other"}
+
+
+@pytest.mark.django_db
+def test_document_list_matches_list_serializer(user, simple_document_content):
+    """Test that the projected list rows match DocumentListSerializer output."""
+    for i in range(3):
+        Document.objects.create(
+            title=f"Doc {i}", content=simple_document_content, created_by=user
+        )
+
+    client = APIClient()
+    client.force_authenticate(user=user)
+    response = client.get(reverse("document-list"))
+
+    expected = DocumentListSerializer(Document.objects.all(), many=True).data
+    assert response.json()["results"] == json.loads(json.dumps(expected))
+
+
 @pytest.mark.django_db
 def test_document_create_authenticated_user(user, simple_document_content):
     """Test document creation with authenticated user."""
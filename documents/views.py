@@ -24,6 +24,7 @@ from .serializers import (
     DocumentChangeSerializer,
     DocumentChangeHistorySerializer,
     DocumentSearchResultSerializer,
+    EagerLoadingMixin,
 )
 from .exceptions import VersionConflictError, InvalidChangeError
 from .api_client import DocumentAPIClient, APIClientError, APIConflictError, APIValidationError
@@ -41,6 +42,19 @@ class DocumentViewSet(viewsets.ModelViewSet):
             return DocumentCreateSerializer
         return DocumentSerializer
 
+    def list(self, request, *args, **kwargs):
+        """List documents from a values() projection instead of model instances."""
+        serializer = self.get_serializer()
+        queryset = self.filter_queryset(self.get_queryset()).values(
+            *serializer.values_fields
+        )
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(serializer.represent_values(page))
+
+        return Response(serializer.represent_values(queryset))
+
     def create(self, request, *args, **kwargs):
         """Create a document and return full document data."""
         serializer = self.get_serializer(data=request.data)
@@ -84,6 +98,11 @@ class DocumentViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         queryset = Document.objects.all()
+        serializer_class = self.get_serializer_class()
+        if issubclass(serializer_class, EagerLoadingMixin):
+            queryset = serializer_class.setup_eager_loading(queryset)
+            if self.action == "retrieve":
+                queryset = serializer_class.annotate_user_names(queryset)
         search = self.request.query_params.get("search", None)
         if search:
             queryset = queryset.filter(
@@ -96,10 +115,12 @@ class DocumentViewSet(viewsets.ModelViewSet):
         """Apply changes to a document with version control."""
         document = self.get_object()
         
-        logger.info(f"Apply changes request for document {pk}")
-        logger.info(f"Request data: {request.data}")
-        logger.info(f"Document current version: {document.version}")
-        logger.info(f"Document content length: {len(document.get_plain_text)}")
+        logger.info("Apply changes request for document %s", pk)
+        # The payload can hold thousands of operations; only repr it for DEBUG
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Request data: %s", request.data)
+        logger.info("Document current version: %s", document.version)
+        logger.info("Document content length: %d", len(document.get_plain_text))
         
         serializer = DocumentChangeSerializer(
             document, data=request.data, context={"request": request}
@@ -111,7 +132,7 @@ class DocumentViewSet(viewsets.ModelViewSet):
             logger.info("Serializer validation passed, applying changes...")
             
             updated_document = serializer.save()
-            logger.info(f"Changes applied successfully, new version: {updated_document.version}")
+            logger.info("Changes applied successfully, new version: %s", updated_document.version)
 
             # Return updated document data
             response_serializer = DocumentSerializer(
@@ -164,7 +185,9 @@ class DocumentViewSet(viewsets.ModelViewSet):
     def change_history(self, request, pk=None):
         """Get change history for a document."""
         document = self.get_object()
-        changes = document.changes.all()
+        changes = DocumentChangeHistorySerializer.annotate_user_names(
+            DocumentChangeHistorySerializer.setup_eager_loading(document.changes.all())
+        )
 
         # Paginate the results
         page = self.paginate_queryset(changes)
@@ -265,9 +288,9 @@ class DocumentWebDetailView(LoginRequiredMixin, DetailView):
         """Handle document updates via API with OT operations"""
         document = self.get_object()
         
-        logger.info(f"Web view POST request for document {document.id}")
-        logger.info(f"User: {request.user}")
-        logger.info(f"POST data keys: {list(request.POST.keys())}")
+        logger.info("Web view POST request for document %s", document.id)
+        logger.info("User: %s", request.user)
+        logger.info("POST data keys: %s", list(request.POST.keys()))
         
         form = DocumentForm(request.POST, instance=document)
         
@@ -279,11 +302,13 @@ class DocumentWebDetailView(LoginRequiredMixin, DetailView):
                 document.refresh_from_db()
                 old_content_text = document.get_plain_text
                 
-                logger.info(f"Document Lexical content: {document.content}")
-                logger.info(f"Old content text: '{old_content_text}'")
-                logger.info(f"Old content length: {len(old_content_text)}")
-                logger.info(f"New content length: {len(content_text)}")
-                logger.info(f"Content changed: {old_content_text != content_text}")
+                # Full document text only goes to DEBUG: it's slow to format
+                # and shouldn't end up in INFO logs
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Old content text: '%s'", old_content_text)
+                    logger.debug("Content changed: %s", old_content_text != content_text)
+                logger.info("Old content length: %d", len(old_content_text))
+                logger.info("New content length: %d", len(content_text))
                 
                 # Create API client
                 api_client = DocumentAPIClient(request.user)
@@ -297,7 +322,7 @@ class DocumentWebDetailView(LoginRequiredMixin, DetailView):
                     document_version=document.version
                 )
                 
-                logger.info(f"Generated API payload: {api_payload}")
+                logger.info("Generated API payload with %d operations", api_payload['operation_count'])
                 
                 # Apply changes via API
                 if api_payload['changes']:  # Only send request if there are changes